@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark of article HTML extractors
+
+Compares parse time and peak memory of the extractors in HTML_EXTRACTORS on
+saved article pages, or on a generated AWS blog-like page when no files are
+given. Also checks that all extractors return the same fields. Peak memory
+is measured with tracemalloc, so memory allocated by lxml's C library is
+not included.
+
+Usage:
+    python benchmarks/extractors.py [--rounds N] [page.html ...]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from awsblogs_mcp_server.data_processor import HTML_EXTRACTORS, lxml_html
+
+
+def generated_page(paragraphs: int = 400) -> str:
+    """Builds page with the layout of an AWS blog post"""
+    nav = "".join(f'<li><a href="/products/{i}/">Product {i}</a></li>' for i in range(300))
+    body = "".join(
+        f'<p>Paragraph {i} about <a href="https://aws.amazon.com/s3/">Amazon S3</a> '
+        f'and <code>aws s3 cp</code> usage.</p>\n'
+        for i in range(paragraphs)
+    )
+    return f"""<!doctype html>
+<html lang="en-US">
+ <head>
+  <meta charset="UTF-8">
+  <title>Example post | AWS News Blog</title>
+  <meta name="description" content="Example description">
+  <meta property="article:published_time" content="2025-07-15T16:01:22-07:00">
+  <script>window.dataLayer = [];</script>
+ </head>
+ <body>
+  <header><nav><ul>{nav}</ul></nav></header>
+  <main>
+   <article class="blog-post">
+    <h1 class="blog-post-title">Example post</h1>
+    <footer class="blog-post-meta">by <span class="author">Jane Doe</span>
+     on <time datetime="2025-07-15T16:01:22-07:00">15 JUL 2025</time></footer>
+    <section class="blog-post-content">{body}</section>
+   </article>
+  </main>
+  <footer><ul>{nav}</ul></footer>
+ </body>
+</html>"""
+
+
+def measure(extract, html: str, rounds: int):
+    """Returns mean seconds per call and peak traced memory of one call"""
+    started = time.perf_counter()
+    for _ in range(rounds):
+        extract(html)
+    seconds = (time.perf_counter() - started) / rounds
+
+    tracemalloc.start()
+    extract(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Article HTML extractor benchmark")
+    parser.add_argument("pages", nargs="*", help="Saved article HTML files (default: generated page)")
+    parser.add_argument("--rounds", type=int, default=10, help="Calls per extractor and page")
+    args = parser.parse_args()
+
+    pages = {}
+    for path in args.pages:
+        with open(path, encoding="utf-8") as f:
+            pages[os.path.basename(path)] = f.read()
+    if not pages:
+        pages["generated"] = generated_page()
+
+    extractors = {name: extract for name, extract in HTML_EXTRACTORS.items()
+                  if name != "lxml" or lxml_html is not None}
+
+    for page, html in pages.items():
+        print(f"{page} ({len(html) / 1024:.0f} KB)")
+        baseline = extractors["bs4"](html)
+        for name, extract in extractors.items():
+            seconds, peak = measure(extract, html, args.rounds)
+            same = "same fields" if extract(html) == baseline else "DIFFERENT FIELDS"
+            print(f"  {name:12} {seconds * 1000:8.1f} ms  {peak / 1024 / 1024:7.1f} MB peak  {same}")
+
+
+if __name__ == "__main__":
+    main()
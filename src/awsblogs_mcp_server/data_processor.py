@@ -5,88 +5,2184 @@ Processes data from https://api.aws-news.com/articles
 """
 
 import asyncio
+import bisect
+import codecs
+import concurrent.futures
+import hashlib
 import json
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+import multiprocessing
+import os
+import random
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Any, List, Optional, Set, Tuple, Callable, Awaitable, Iterator
 import aiohttp
 from dateutil import parser as date_parser
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import re
+import itertools
+import math
+from dataclasses import dataclass
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+try:
+    import zstandard
+except ImportError:  # optional, zlib is used instead
+    zstandard = None
+
+try:
+    from lxml import etree as lxml_etree, html as lxml_html
+except ImportError:  # optional, BeautifulSoup is used instead
+    lxml_etree = lxml_html = None
+
+try:
+    import orjson
+except ImportError:  # optional, msgspec or json is used instead
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional, json is used instead
+    msgspec = None
+
+try:
+    from aiohttp.compression_utils import HAS_BROTLI
+except ImportError:  # aiohttp without brotli support
+    HAS_BROTLI = False
+
+try:
+    from aiohttp.compression_utils import HAS_ZSTD
+except ImportError:  # aiohttp without zstd support
+    HAS_ZSTD = False
+
+
+# Content codings aiohttp can decode in this environment
+ACCEPT_ENCODING = ", ".join(
+    ["gzip", "deflate"] + (["br"] if HAS_BROTLI else []) + (["zstd"] if HAS_ZSTD else [])
+)
+
+# Fastest installed JSON decoder for the article feed and snapshot
+if orjson is not None:
+    JSON_DECODER = "orjson"
+    decode_json: Callable[[bytes], Any] = orjson.loads
+elif msgspec is not None:
+    JSON_DECODER = "msgspec"
+    decode_json = msgspec.json.decode
+else:
+    JSON_DECODER = "json"
+    decode_json = json.loads
+
+
+@dataclass
+class ArticleQuery:
+    """Article query evaluated by AWSNewsAPI.query in a single pass"""
+    
+    from_date: Optional[str] = None      # From date (YYYY-MM-DD)
+    to_date: Optional[str] = None        # To date (YYYY-MM-DD)
+    days_back: Optional[int] = None      # Number of days back from today (overrides from_date)
+    category: Optional[str] = None       # Main category (case-insensitive)
+    article_type: str = "Both"           # "News", "Blog", or "Both"
+    popular_only: bool = False           # Only articles marked as popular
+    text: Optional[str] = None           # Substring of title, URL or slug (case-insensitive)
+    match: Optional[str] = None          # Full-text query over cached articles (all terms, BM25 ranked)
+    sort: str = "newest"                 # "newest", "relevance" (with match) or "source" (keep order of source list)
+    limit: int = 0                       # Maximum number of articles (0 = no limit)
+    
+    def date_bounds(self) -> Tuple[Optional[date], Optional[date]]:
+        """Returns (from, to) dates of the query, None for unbounded side"""
+        from_date = self.from_date
+        if self.days_back:
+            from_date = (datetime.now() - timedelta(days=self.days_back)).strftime("%Y-%m-%d")
+        
+        from_dt = datetime.strptime(from_date, "%Y-%m-%d").date() if from_date else None
+        to_dt = datetime.strptime(self.to_date, "%Y-%m-%d").date() if self.to_date else None
+        return from_dt, to_dt
+
+
+# Fixed-offset time zones shared by parsed publication dates
+_TIMEZONES: Dict[timedelta, timezone] = {}
+
+
+def parse_published_date(published_date: Any) -> Optional[datetime]:
+    """
+    Parses article publication date (ISO 8601), None if missing or invalid
+    
+    dateutil attaches a new tzutc/tzlocal/tzoffset object to every result;
+    these are replaced by a shared fixed-offset timezone with the same offset.
+    """
+    if not published_date:
+        return None
+    try:
+        published = date_parser.parse(published_date)
+        offset = published.utcoffset()
+    except (ValueError, TypeError, OverflowError):
+        return None
+    if offset is None:
+        return published
+    tz = _TIMEZONES.get(offset)
+    if tz is None:
+        tz = _TIMEZONES[offset] = timezone(offset) if offset else timezone.utc
+    return published.replace(tzinfo=tz)
+
+
+class Article:
+    """
+    Article record of AWS News API, normalized once at ingest
+    
+    Filters and formatting read precomputed attributes (lowercase type and
+    category, parsed publication time, boolean flags) instead of looking up
+    and normalizing dict values on every query. Type and category strings
+    repeat across articles and are interned. Fields the client does not use
+    are kept in extra, so to_dict returns the complete record.
+    """
+    
+    # Fields of the API record stored as attributes
+    FIELDS = ("id", "title", "type", "main_category", "published_date", "url", "slug",
+              "popular", "is_regional_expansion")
+    
+    __slots__ = FIELDS + ("extra", "key", "type_lower", "category_lower", "published_at")
+    
+    def __init__(self, data: Dict[str, Any]):
+        (self.id, self.title, self.type, self.main_category, self.published_date,
+         self.url, self.slug, self.popular, self.is_regional_expansion, self.extra) = self._normalize(data)
+        # Store key: API id, URL as fallback
+        self.key = self.id or self.url or None
+        self.type_lower = sys.intern(self.type.lower())
+        self.category_lower = sys.intern(self.main_category.lower())
+        # None = missing or invalid date
+        self.published_at = parse_published_date(self.published_date)
+    
+    @classmethod
+    def _normalize(cls, data: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Returns normalized values of FIELDS followed by the remaining fields"""
+        def text(name: str, intern: bool = False) -> str:
+            value = data.get(name) or ""
+            if not isinstance(value, str):
+                value = str(value)
+            return sys.intern(value) if intern else value
+        
+        return (
+            data.get("id") or "",
+            text("title"),
+            text("type", intern=True),
+            text("main_category", intern=True),
+            text("published_date"),
+            text("url"),
+            text("slug"),
+            data.get("popular") == True,
+            data.get("is_regional_expansion") == True,
+            {name: value for name, value in data.items() if name not in cls.FIELDS} or None,
+        )
+    
+    def same_source(self, data: Dict[str, Any]) -> bool:
+        """Checks whether API record would build an identical article (without parsing its date)"""
+        return tuple(getattr(self, name) for name in self.FIELDS) + (self.extra,) == self._normalize(data)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the record as API-shaped dict (used by the snapshot)"""
+        data = {name: getattr(self, name) for name in self.FIELDS}
+        if self.extra:
+            data.update(self.extra)
+        return data
+    
+    def __repr__(self) -> str:
+        return f"Article(key={self.key!r}, title={self.title!r})"
+
+
+def estimate_size(value: Any) -> int:
+    """Roughly estimates memory used by a JSON-like value in bytes"""
+    if isinstance(value, Article):
+        return 48 + 8 * len(Article.__slots__) + sum(
+            estimate_size(getattr(value, name)) for name in Article.__slots__
+        )
+    if isinstance(value, str):
+        return 50 + len(value)
+    if isinstance(value, dict):
+        return 100 + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return 56 + 8 * len(value) + sum(estimate_size(item) for item in value)
+    return 32
+
+
+class CacheEntry:
+    """Single entry stored in CacheManager"""
+    
+    __slots__ = ("value", "size", "created", "expires_at", "last_access", "hits")
+    
+    def __init__(self, value: Any, size: int, ttl: float):
+        now = time.monotonic()
+        self.value = value
+        self.size = size
+        self.created = now
+        self.expires_at = now + ttl
+        self.last_access = now
+        self.hits = 0
+
+
+# Eviction policies: victim is the entry with the lowest key
+EVICTION_POLICIES: Dict[str, Callable[[CacheEntry], Any]] = {
+    "lru": lambda entry: entry.last_access,
+    "lfu": lambda entry: (entry.hits, entry.last_access),
+    "ttl": lambda entry: entry.expires_at,
+}
+
+
+class CacheNamespace:
+    """View of CacheManager entries sharing a TTL and entry limit"""
+    
+    def __init__(self, manager: "CacheManager", name: str, ttl: float, max_entries: int):
+        self.manager = manager
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.entries: Dict[Any, CacheEntry] = {}
+        self.bytes = 0
+        self.counters = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+    
+    def get(self, key: Any) -> Optional[Any]:
+        """Returns cached value (None if missing or expired)"""
+        return self.manager.get(self, key)
+    
+    def set(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
+        """Stores value (ttl overrides namespace TTL)"""
+        self.manager.set(self, key, value, self.ttl if ttl is None else ttl)
+    
+    def delete(self, key: Any) -> None:
+        """Removes entry if present"""
+        if key in self.entries:
+            self.manager.remove(self, key)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Returns namespace counters and usage"""
+        return {
+            **self.counters,
+            "entries": len(self.entries),
+            "estimated_bytes": self.bytes,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+        }
+
+
+class CacheManager:
+    """
+    Shared memory budget for all client caches
+    
+    Entries live in namespaces (search results, article content, ...) with
+    their own TTL and entry limit, while the estimated size of all entries
+    together is kept under max_bytes. Expired entries are dropped first, then
+    victims are chosen by the eviction policy (see EVICTION_POLICIES).
+    """
+    
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, policy: str = "lru"):
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy: {policy}")
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.namespaces: Dict[str, CacheNamespace] = {}
+        self.bytes = 0
+    
+    def namespace(self, name: str, ttl: float, max_entries: int) -> CacheNamespace:
+        """Gets or creates namespace"""
+        if name not in self.namespaces:
+            self.namespaces[name] = CacheNamespace(self, name, ttl, max_entries)
+        return self.namespaces[name]
+    
+    def get(self, namespace: CacheNamespace, key: Any) -> Optional[Any]:
+        """Returns cached value (None if missing or expired)"""
+        entry = namespace.entries.get(key)
+        if entry is None:
+            namespace.counters["misses"] += 1
+            return None
+        now = time.monotonic()
+        if entry.expires_at <= now:
+            self.remove(namespace, key)
+            namespace.counters["expirations"] += 1
+            namespace.counters["misses"] += 1
+            return None
+        entry.last_access = now
+        entry.hits += 1
+        namespace.counters["hits"] += 1
+        return entry.value
+    
+    def set(self, namespace: CacheNamespace, key: Any, value: Any, ttl: float) -> None:
+        """Stores value and evicts entries over namespace limit or memory budget"""
+        if key in namespace.entries:
+            self.remove(namespace, key)
+        size = estimate_size(value)
+        if size > self.max_bytes or namespace.max_entries <= 0:
+            return
+        
+        namespace.entries[key] = CacheEntry(value, size, ttl)
+        namespace.bytes += size
+        self.bytes += size
+        
+        if len(namespace.entries) > namespace.max_entries:
+            self._evict([namespace], lambda: len(namespace.entries) > namespace.max_entries)
+        if self.bytes > self.max_bytes:
+            self._evict(list(self.namespaces.values()), lambda: self.bytes > self.max_bytes)
+    
+    def remove(self, namespace: CacheNamespace, key: Any) -> None:
+        """Removes entry"""
+        entry = namespace.entries.pop(key)
+        namespace.bytes -= entry.size
+        self.bytes -= entry.size
+    
+    def _evict(self, namespaces: List[CacheNamespace], over_limit: Callable[[], bool]) -> None:
+        """Evicts entries from namespaces while over_limit() holds"""
+        now = time.monotonic()
+        for namespace in namespaces:
+            for key in [key for key, entry in namespace.entries.items() if entry.expires_at <= now]:
+                self.remove(namespace, key)
+                namespace.counters["expirations"] += 1
+        
+        policy_key = EVICTION_POLICIES[self.policy]
+        while over_limit():
+            candidates = [
+                (policy_key(entry), namespace, key)
+                for namespace in namespaces
+                for key, entry in namespace.entries.items()
+            ]
+            if not candidates:
+                break
+            _, namespace, key = min(candidates, key=lambda candidate: candidate[0])
+            self.remove(namespace, key)
+            namespace.counters["evictions"] += 1
+    
+    def stats(self, include_entries: bool = False) -> Dict[str, Any]:
+        """
+        Returns memory usage and counters of all namespaces
+        
+        Args:
+            include_entries: Include per-entry details (largest entries first)
+            
+        Returns:
+            Dict with budget, policy and per-namespace statistics
+        """
+        result: Dict[str, Any] = {
+            "policy": self.policy,
+            "max_bytes": self.max_bytes,
+            "estimated_bytes": self.bytes,
+            "namespaces": {name: namespace.stats() for name, namespace in self.namespaces.items()},
+        }
+        if include_entries:
+            now = time.monotonic()
+            entries = [
+                {
+                    "namespace": name,
+                    "key": str(key),
+                    "estimated_bytes": entry.size,
+                    "hits": entry.hits,
+                    "age_seconds": round(now - entry.created, 1),
+                    "expires_in_seconds": round(entry.expires_at - now, 1),
+                }
+                for name, namespace in self.namespaces.items()
+                for key, entry in namespace.entries.items()
+            ]
+            result["entries"] = sorted(entries, key=lambda entry: entry["estimated_bytes"], reverse=True)
+        return result
+
+
+class ArticleStrainer(SoupStrainer):
+    """
+    Lets only elements read by extract_article_bs4 into the parse tree
+    
+    Matching elements are kept with all their contents, the rest of the page
+    (navigation, scripts, footers, links) is never turned into tree objects.
+    Paragraphs are not kept: they are only read when the page has no content
+    container, and an unclosed <p> whose parent was skipped would swallow
+    the rest of the page.
+    """
+    
+    # pre and textarea are kept so whitespace inside them stays preserved
+    TAGS = frozenset(["title", "meta", "h1", "time", "main", "pre", "textarea"])
+    CLASSES = frozenset([
+        "blog-post-content", "entry-content", "post-content", "content",
+        "blog-post-body", "post-body", "author", "byline", "post-author",
+        "publish-date", "date",
+    ])
+    
+    def __init__(self):
+        super().__init__(name=True)
+    
+    def wants(self, name: str, attrs: Optional[Dict[str, Any]]) -> bool:
+        """Returns whether a tag with given name and attributes is kept"""
+        if name in self.TAGS:
+            return True
+        classes = attrs.get("class") if attrs else None
+        if not classes:
+            return False
+        if isinstance(classes, str):
+            classes = classes.split()
+        return not self.CLASSES.isdisjoint(classes)
+    
+    def allow_tag_creation(self, nsprefix: Optional[str], name: str, attrs: Optional[Dict[str, Any]]) -> bool:
+        # beautifulsoup4 >= 4.13
+        return self.wants(name, attrs)
+    
+    def search_tag(self, markup_name: Any = None, markup_attrs: Any = None) -> bool:
+        # beautifulsoup4 < 4.13
+        return self.wants(markup_name, markup_attrs)
+
+
+def extract_article_bs4(html_content: str, parse_only: Optional[SoupStrainer] = None) -> Dict[str, str]:
+    """
+    Extracts article fields from page HTML using BeautifulSoup
+    
+    Args:
+        html_content: Page HTML
+        parse_only: Strainer limiting which elements are parsed (None = whole page)
+        
+    Returns:
+        Dict with title, content, description, author and published_date
+    """
+    # Parse HTML using BeautifulSoup
+    soup = BeautifulSoup(html_content, 'html.parser', parse_only=parse_only)
+    
+    # Extract title
+    title = ""
+    title_tag = soup.find('h1') or soup.find('title')
+    if title_tag:
+        title = title_tag.get_text().strip()
+    
+    # Extract main content
+    content = ""
+    
+    # Try to find main article content
+    # AWS blogs usually use these selectors
+    content_selectors = [
+        'div.blog-post-content',
+        'div.entry-content', 
+        'article.post-content',
+        'div.content',
+        'main',
+        '.blog-post-body',
+        '.post-body'
+    ]
+    
+    content_element = None
+    for selector in content_selectors:
+        content_element = soup.select_one(selector)
+        if content_element:
+            break
+    
+    # If we don't find specific selector, take all p tags
+    if not content_element:
+        if parse_only is not None:
+            # Paragraphs are not parsed by the strainer, parse the whole page
+            return extract_article_bs4(html_content)
+        paragraphs = soup.find_all('p')
+        if paragraphs:
+            content = '\n\n'.join([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
+    else:
+        # Clean content from unnecessary tags
+        # Remove scripts, styles, navigation, etc.
+        for unwanted in content_element(['script', 'style', 'nav', 'header', 'footer', 'aside']):
+            unwanted.decompose()
+        
+        # Get clean text
+        content = content_element.get_text()
+        
+        # Clean excessive whitespace
+        content = re.sub(r'\n\s*\n', '\n\n', content)
+        content = re.sub(r' +', ' ', content)
+        content = content.strip()
+    
+    # Extract meta information
+    meta_description = ""
+    meta_tag = soup.find('meta', attrs={'name': 'description'}) or soup.find('meta', attrs={'property': 'og:description'})
+    if meta_tag:
+        meta_description = meta_tag.get('content', '').strip()
+    
+    # Extract author
+    author = ""
+    author_selectors = [
+        'meta[name="author"]',
+        '.author',
+        '.byline', 
+        '.post-author'
+    ]
+    
+    for selector in author_selectors:
+        author_element = soup.select_one(selector)
+        if author_element:
+            if author_element.name == 'meta':
+                author = author_element.get('content', '').strip()
+            else:
+                author = author_element.get_text().strip()
+            break
+    
+    # Extract publication date from HTML
+    pub_date = ""
+    date_selectors = [
+        'time[datetime]',
+        'meta[property="article:published_time"]',
+        '.publish-date',
+        '.date'
+    ]
+    
+    for selector in date_selectors:
+        date_element = soup.select_one(selector)
+        if date_element:
+            if date_element.name == 'time':
+                pub_date = date_element.get('datetime', '').strip()
+            elif date_element.name == 'meta':
+                pub_date = date_element.get('content', '').strip()
+            else:
+                pub_date = date_element.get_text().strip()
+            break
+    
+    return {
+        "title": title,
+        "content": content,
+        "description": meta_description,
+        "author": author,
+        "published_date": pub_date
+    }
+
+
+def extract_article_bs4_partial(html_content: str) -> Dict[str, str]:
+    """
+    Extracts article fields using BeautifulSoup, parsing only elements
+    matched by ArticleStrainer
+    
+    Args:
+        html_content: Page HTML
+        
+    Returns:
+        Dict with title, content, description, author and published_date
+    """
+    return extract_article_bs4(html_content, ArticleStrainer())
+
+
+# Elements whose text BeautifulSoup's get_text() leaves out
+LXML_NON_TEXT_TAGS = frozenset(["script", "style", "template", "rt", "rp"])
+# Elements removed from the main content before taking its text
+LXML_UNWANTED_TAGS = ("script", "style", "nav", "header", "footer", "aside")
+# Elements in which BeautifulSoup keeps whitespace-only text as is
+LXML_PRESERVE_WHITESPACE_TAGS = ("pre", "textarea")
+
+
+def _lxml_class_xpath(tag: str, css_class: str) -> str:
+    """Returns XPath equivalent of CSS selector tag.css_class"""
+    return f"//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {css_class} ')]"
+
+
+def _bs4_string(text: Optional[str], preserve: bool) -> Optional[str]:
+    """Collapses whitespace-only text to one newline or space like BeautifulSoup does"""
+    if not text or preserve or text.strip(" \n\t\f\r"):
+        return text
+    return "\n" if "\n" in text else " "
+
+
+def _lxml_collapse_whitespace(node: Any, preserve: bool = False) -> None:
+    """
+    Collapses whitespace-only strings of parsed document the way BeautifulSoup's
+    tree builder does, so text matches extract_article_bs4
+    
+    Args:
+        node: lxml element
+        preserve: Whether node is inside an element keeping whitespace
+    """
+    preserve = preserve or node.tag in LXML_PRESERVE_WHITESPACE_TAGS
+    node.text = _bs4_string(node.text, preserve)
+    for child in node:
+        if isinstance(child.tag, str):
+            _lxml_collapse_whitespace(child, preserve)
+        child.tail = _bs4_string(child.tail, preserve)
+
+
+def _lxml_text(element: Any) -> str:
+    """
+    Gets text of lxml element the way BeautifulSoup's get_text() does
+    
+    Args:
+        element: lxml element
+        
+    Returns:
+        Concatenated text without comments, scripts and styles
+    """
+    parts: List[str] = []
+    
+    def collect(node: Any) -> None:
+        if node.text:
+            parts.append(node.text)
+        for child in node:
+            # Comments and processing instructions have a non-string tag
+            if isinstance(child.tag, str) and child.tag not in LXML_NON_TEXT_TAGS:
+                collect(child)
+            if child.tail:
+                parts.append(child.tail)
+    
+    collect(element)
+    return "".join(parts)
+
+
+def _lxml_first(root: Any, xpaths: List[str]) -> Any:
+    """Returns first element matched by the first matching XPath, None if none match"""
+    for xpath in xpaths:
+        found = root.xpath(xpath)
+        if found:
+            return found[0]
+    return None
+
+
+def extract_article_lxml(html_content: str) -> Dict[str, str]:
+    """
+    Extracts article fields from page HTML using lxml
+    
+    Mirrors extract_article_bs4 with XPath equivalents of its selectors.
+    Documents lxml cannot parse are handed over to extract_article_bs4.
+    
+    Args:
+        html_content: Page HTML
+        
+    Returns:
+        Dict with title, content, description, author and published_date
+    """
+    try:
+        root = lxml_html.document_fromstring(html_content)
+    except (lxml_etree.ParserError, ValueError):
+        return extract_article_bs4(html_content)
+    _lxml_collapse_whitespace(root)
+    
+    # Extract title
+    title = ""
+    title_tag = _lxml_first(root, ["//h1", "//title"])
+    if title_tag is not None:
+        title = _lxml_text(title_tag).strip()
+    
+    # Extract main content, selectors as in extract_article_bs4
+    content = ""
+    content_element = _lxml_first(root, [
+        _lxml_class_xpath("div", "blog-post-content"),
+        _lxml_class_xpath("div", "entry-content"),
+        _lxml_class_xpath("article", "post-content"),
+        _lxml_class_xpath("div", "content"),
+        "//main",
+        _lxml_class_xpath("*", "blog-post-body"),
+        _lxml_class_xpath("*", "post-body"),
+    ])
+    
+    if content_element is None:
+        texts = (_lxml_text(p).strip() for p in root.iter("p"))
+        content = '\n\n'.join([text for text in texts if text])
+    else:
+        # Removed from the whole document, so later selectors skip them as well
+        for unwanted in list(content_element.iterdescendants(*LXML_UNWANTED_TAGS)):
+            unwanted.drop_tree()
+        content = _lxml_text(content_element)
+        
+        # Clean excessive whitespace
+        content = re.sub(r'\n\s*\n', '\n\n', content)
+        content = re.sub(r' +', ' ', content)
+        content = content.strip()
+    
+    # Extract meta information
+    meta_description = ""
+    meta_tag = _lxml_first(root, ['//meta[@name="description"]', '//meta[@property="og:description"]'])
+    if meta_tag is not None:
+        meta_description = meta_tag.get('content', '').strip()
+    
+    # Extract author
+    author = ""
+    author_element = _lxml_first(root, [
+        '//meta[@name="author"]',
+        _lxml_class_xpath("*", "author"),
+        _lxml_class_xpath("*", "byline"),
+        _lxml_class_xpath("*", "post-author"),
+    ])
+    if author_element is not None:
+        if author_element.tag == 'meta':
+            author = author_element.get('content', '').strip()
+        else:
+            author = _lxml_text(author_element).strip()
+    
+    # Extract publication date from HTML
+    pub_date = ""
+    date_element = _lxml_first(root, [
+        '//time[@datetime]',
+        '//meta[@property="article:published_time"]',
+        _lxml_class_xpath("*", "publish-date"),
+        _lxml_class_xpath("*", "date"),
+    ])
+    if date_element is not None:
+        if date_element.tag == 'time':
+            pub_date = date_element.get('datetime', '').strip()
+        elif date_element.tag == 'meta':
+            pub_date = date_element.get('content', '').strip()
+        else:
+            pub_date = _lxml_text(date_element).strip()
+    
+    return {
+        "title": title,
+        "content": content,
+        "description": meta_description,
+        "author": author,
+        "published_date": pub_date
+    }
+
+
+# Article extractors by name, "auto" picks lxml when installed, partial
+# BeautifulSoup parsing otherwise
+HTML_EXTRACTORS: Dict[str, Callable[[str], Dict[str, str]]] = {
+    "lxml": extract_article_lxml,
+    "bs4-partial": extract_article_bs4_partial,
+    "bs4": extract_article_bs4,
+}
+
+
+def resolve_extractor(name: str) -> str:
+    """
+    Resolves extractor name to an available extractor
+    
+    Args:
+        name: Extractor name or "auto"
+        
+    Returns:
+        Name of extractor in HTML_EXTRACTORS
+    """
+    if name == "auto":
+        return "lxml" if lxml_html is not None else "bs4-partial"
+    if name not in HTML_EXTRACTORS:
+        raise ValueError(f"Unknown HTML extractor: {name}")
+    if name == "lxml" and lxml_html is None:
+        raise ValueError("HTML extractor lxml requires the lxml package")
+    return name
+
+
+def parse_article_html(html_content: str, extractor: str = "auto") -> Dict[str, Any]:
+    """
+    Extracts article fields from page HTML
+    
+    Pure function without access to client state, so it can run in a worker
+    process or thread.
+    
+    Args:
+        html_content: Page HTML
+        extractor: Name of extractor in HTML_EXTRACTORS or "auto"
+        
+    Returns:
+        Dict with title, content, description, author, published_date,
+        content_length and word_count
+    """
+    fields = HTML_EXTRACTORS[resolve_extractor(extractor)](html_content)
+    content = fields["content"]
+    return {
+        **fields,
+        "content_length": len(content),
+        "word_count": len(content.split()) if content else 0
+    }
+
+
+class ContentEndScanner:
+    """
+    Finds where the article content container ends in a page read in chunks
+    
+    The page can be cut once the first <div class="blog-post-content">, the
+    highest priority container of the extractors, or the <main> element has
+    closed. On AWS pages the title, author and date precede that point.
+    Nesting is followed by counting div tags, which is cheap and good enough
+    for article markup.
+    """
+    
+    START = re.compile(rb'<div\b[^>]*\bclass\s*=\s*["\']?[^"\'>]*(?<![\w-])blog-post-content(?![\w-])[^>]*>', re.I)
+    DIV_TAG = re.compile(rb'<(/?)div\b[^>]*>', re.I)
+    MAIN_END = re.compile(rb'</main\s*>', re.I)
+    # Longest tag expected to be split across chunks
+    MAX_TAG_BYTES = 2048
+    
+    def __init__(self):
+        self._pos = 0
+        self._main_pos = 0
+        self._depth: Optional[int] = None
+    
+    def feed(self, buffer: bytearray) -> Optional[int]:
+        """
+        Scans bytes added to buffer since the previous call
+        
+        Args:
+            buffer: Page bytes read so far
+            
+        Returns:
+            Offset just after the closing tag of the container, None while open
+        """
+        end = self._container_end(buffer)
+        if end is None:
+            match = self.MAIN_END.search(buffer, self._main_pos)
+            if match is not None:
+                return match.end()
+            self._main_pos = max(self._main_pos, len(buffer) - self.MAX_TAG_BYTES)
+        return end
+    
+    def _container_end(self, buffer: bytearray) -> Optional[int]:
+        """Follows div nesting from the first blog-post-content container"""
+        if self._depth is None:
+            match = self.START.search(buffer, self._pos)
+            if match is None:
+                # Rescan the tail next time, the start tag may be incomplete
+                self._pos = max(self._pos, len(buffer) - self.MAX_TAG_BYTES)
+                return None
+            self._depth = 1
+            self._pos = match.end()
+        
+        for match in self.DIV_TAG.finditer(buffer, self._pos):
+            self._pos = match.end()
+            self._depth += -1 if match.group(1) else 1
+            if self._depth == 0:
+                return match.end()
+        return None
+
+
+class ContentStore:
+    """
+    SQLite store of parsed article content surviving restarts
+    
+    Pages (normalized URL) point to content rows keyed by SHA-256 hash of the
+    parsed result, so identical content is stored once. Results are stored as
+    zstd (when zstandard is installed) or zlib compressed JSON and read through
+    SQLite memory-mapped I/O. Methods are blocking and thread-safe, callers on
+    the event loop should run them in an executor.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS contents (
+            content_hash TEXT PRIMARY KEY,
+            codec TEXT NOT NULL,
+            payload BLOB NOT NULL,
+            raw_size INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS pages (
+            url TEXT PRIMARY KEY,
+            content_hash TEXT NOT NULL REFERENCES contents(content_hash),
+            fetched_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS pages_content_hash ON pages(content_hash);
+    """
+    
+    # Errors raised when decompressing a corrupt payload
+    DECOMPRESS_ERRORS: Tuple[type, ...] = (zlib.error,) + (
+        (zstandard.ZstdError,) if zstandard is not None else ()
+    )
+    
+    def __init__(self, path: str, mmap_size: int = 256 * 1024 * 1024):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.codec = "zstd" if zstandard is not None else "zlib"
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+        self._db.executescript(self.SCHEMA)
+        self._db.commit()
+    
+    def _compress(self, raw: bytes) -> bytes:
+        if self.codec == "zstd":
+            return zstandard.ZstdCompressor(level=6).compress(raw)
+        return zlib.compress(raw, 6)
+    
+    @staticmethod
+    def _decompress(codec: str, payload: bytes) -> Optional[bytes]:
+        if codec == "zstd":
+            if zstandard is None:
+                return None
+            return zstandard.ZstdDecompressor().decompress(payload)
+        return zlib.decompress(payload)
+    
+    def _readable(self, codec: str, payload: bytes) -> bool:
+        """Checks whether stored payload is in the current codec and decodes"""
+        if codec != self.codec:
+            return False
+        try:
+            return self._decompress(codec, payload) is not None
+        except self.DECOMPRESS_ERRORS:
+            return False
+    
+    def get(self, url: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Gets stored content of page
+        
+        Args:
+            url: Normalized page URL
+            max_age: Maximum age in seconds (None = any)
+            
+        Returns:
+            Stored result, None if missing, too old or unreadable
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT c.codec, c.payload, p.fetched_at FROM pages p "
+                "JOIN contents c ON c.content_hash = p.content_hash WHERE p.url = ?",
+                (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        codec, payload, fetched_at = row
+        if max_age is not None and time.time() - fetched_at > max_age:
+            return None
+        raw = self._decompress(codec, payload)
+        return json.loads(raw) if raw is not None else None
+    
+    def put(self, url: str, result: Dict[str, Any]) -> None:
+        """
+        Stores page content, replacing previous content of the page
+        
+        Args:
+            url: Normalized page URL
+            result: Parsed content result
+        """
+        # URL is supplied by the caller on read, leaving it out lets aliases share content
+        result = {k: v for k, v in result.items() if k != "url"}
+        raw = json.dumps(result, separators=(",", ":"), sort_keys=True).encode("utf-8")
+        content_hash = hashlib.sha256(raw).hexdigest()
+        with self._lock:
+            previous = self._db.execute(
+                "SELECT content_hash FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+            stored = self._db.execute(
+                "SELECT codec, payload FROM contents WHERE content_hash = ?", (content_hash,)
+            ).fetchone()
+            if stored is None:
+                self._db.execute(
+                    "INSERT INTO contents (content_hash, codec, payload, raw_size) VALUES (?, ?, ?, ?)",
+                    (content_hash, self.codec, self._compress(raw), len(raw))
+                )
+            elif not self._readable(*stored):
+                # Written with a codec that is not available now, or corrupt
+                self._db.execute(
+                    "UPDATE contents SET codec = ?, payload = ?, raw_size = ? WHERE content_hash = ?",
+                    (self.codec, self._compress(raw), len(raw), content_hash)
+                )
+            self._db.execute(
+                "INSERT OR REPLACE INTO pages (url, content_hash, fetched_at) VALUES (?, ?, ?)",
+                (url, content_hash, time.time())
+            )
+            # Drop previous content of the page unless another page shares it
+            if previous is not None and previous[0] != content_hash:
+                self._db.execute(
+                    "DELETE FROM contents WHERE content_hash = ? AND NOT EXISTS "
+                    "(SELECT 1 FROM pages WHERE content_hash = ?)",
+                    (previous[0], previous[0])
+                )
+            self._db.commit()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Returns number of stored pages and their raw and compressed size"""
+        with self._lock:
+            pages = self._db.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+            contents, raw_size, stored_size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(raw_size), 0), COALESCE(SUM(LENGTH(payload)), 0) FROM contents"
+            ).fetchone()
+        return {
+            "path": self.path,
+            "codec": self.codec,
+            "pages": pages,
+            "unique_contents": contents,
+            "raw_bytes": raw_size,
+            "stored_bytes": stored_size,
+        }
+    
+    def close(self) -> None:
+        """Closes database"""
+        with self._lock:
+            self._db.close()
 
 
 class AWSNewsAPI:
     """Client for working with AWS News API"""
     
-    BASE_URL = "https://api.aws-news.com/articles"
+    BASE_URL = "https://api.aws-news.com/articles"
+    
+    # Available AWS blog categories
+    AVAILABLE_CATEGORIES = [
+        "Architecture",
+        "AWS Cloud Operations", 
+        "AWS for Games",
+        "AWS Insights",
+        "AWS Marketplace",
+        "AWS News",
+        "AWS Partner Network",
+        "AWS Smart Business",
+        "Big Data",
+        "Business Intelligence",
+        "Business Productivity",
+        "Cloud Enterprise Strategy",
+        "Cloud Financial Management",
+        "Compute",
+        "Contact Center",
+        "Containers",
+        "Database",
+        "Desktop & Application Streaming",
+        "Developer Tools",
+        "DevOps & Developer Productivity",
+        "Front-End Web & Mobile",
+        "HPC",
+        "IBM and Red Hat",
+        "Industries",
+        "Integration & Automation",
+        "Internet of Things",
+        "Machine Learning",
+        "Media",
+        "Messaging & Targeting",
+        "Microsoft Workloads on AWS",
+        "Migration and Modernization",
+        ".NET on AWS",
+        "Networking & Content Delivery",
+        "Open Source",
+        "Public Sector",
+        "Quantum Computing",
+        "SAP",
+        "Security",
+        "Spatial Computing",
+        "Startups",
+        "Storage",
+        "Supply Chain & Logistics",
+        "Training & Certification"
+    ]
+    
+    # Options that can be changed at runtime via configure()
+    CONFIG_OPTIONS = (
+        "soft_ttl",
+        "hard_ttl",
+        "max_staleness",
+        "refresh_interval",
+        "refresh_jitter",
+        "snapshot_path",
+        "search_cache_size",
+        "search_cache_ttl",
+        "cache_max_bytes",
+        "cache_policy",
+        "content_cache_size",
+        "content_cache_ttl",
+        "content_missing_ttl",
+        "content_store_max_age",
+        "content_concurrency",
+        "content_per_host",
+        "content_max_bytes",
+        "content_early_stop",
+        "pool_limit",
+        "pool_limit_per_host",
+        "keepalive_timeout",
+        "dns_cache_ttl",
+        "happy_eyeballs",
+        "connect_timeout",
+        "read_timeout",
+        "total_timeout",
+        "parse_executor",
+        "parse_workers",
+        "html_extractor",
+    )
+    
+    # Where article HTML is parsed: worker processes, worker threads or the event loop
+    PARSE_EXECUTORS = ("process", "thread", "inline")
+    
+    # Fields indexed at ingest, mapped to functions returning normalized value
+    INDEXED_FIELDS: Dict[str, Callable[[Article], Any]] = {
+        "category": lambda article: article.category_lower,
+        "type": lambda article: article.type_lower,
+        "popular": lambda article: article.popular,
+        "regional_expansion": lambda article: article.is_regional_expansion,
+    }
+    
+    # Header of the on-disk article snapshot, followed by zlib-compressed JSON
+    SNAPSHOT_MAGIC = b"AWSBLOGS-SNAPSHOT-1\n"
+    
+    def __init__(self, soft_ttl: int = 300, hard_ttl: int = 3600, max_staleness: int = 86400,
+                 refresh_interval: int = 240, refresh_jitter: int = 30,
+                 snapshot_path: Optional[str] = None, search_cache_size: int = 256,
+                 search_cache_ttl: int = 300, cache_max_bytes: int = 64 * 1024 * 1024,
+                 cache_policy: str = "lru", content_cache_size: int = 512,
+                 content_cache_ttl: int = 3600, content_missing_ttl: int = 600,
+                 content_store_path: Optional[str] = None, content_store_max_age: int = 7 * 86400,
+                 content_concurrency: int = 8, content_per_host: int = 4,
+                 content_max_bytes: int = 5 * 1024 * 1024, content_early_stop: bool = False,
+                 pool_limit: int = 100, pool_limit_per_host: int = 16,
+                 keepalive_timeout: float = 60, dns_cache_ttl: int = 300,
+                 happy_eyeballs: bool = True, connect_timeout: float = 10,
+                 read_timeout: float = 30, total_timeout: float = 60,
+                 parse_executor: str = "process", parse_workers: Optional[int] = None,
+                 html_extractor: str = "auto"):
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Connection pool and timeouts of the HTTP session (0 = no limit),
+        # changes apply to the next session created
+        self._pool_limit = pool_limit
+        self._pool_limit_per_host = pool_limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._dns_cache_ttl = dns_cache_ttl
+        self._happy_eyeballs = happy_eyeballs
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+        self._total_timeout = total_timeout
+        self._session_options: Optional[Tuple[Any, ...]] = None
+        # Replaced sessions, closed once their requests have timed out
+        self._retired_sessions: Set[aiohttp.ClientSession] = set()
+        self._pool_stats: Dict[str, Any] = {
+            "sessions_created": 0,
+            "requests": 0,
+            "request_errors": 0,
+            "connections_created": 0,
+            "connections_reused": 0,
+            "requests_queued": 0,
+            "queue_wait_seconds": 0.0,
+            "dns_cache_hits": 0,
+            "dns_cache_misses": 0,
+        }
+        self._cache: Dict[str, Any] = {}
+        # Stale-while-revalidate policy for the article list (seconds):
+        # - younger than soft_ttl: served as fresh
+        # - younger than hard_ttl: served stale, refreshed in background
+        # - older: caller waits for refresh, stale data up to max_staleness
+        #   is served only when the refresh fails
+        self._soft_ttl = soft_ttl
+        self._hard_ttl = hard_ttl
+        self._max_staleness = max_staleness
+        self._last_fetch = None
+        self._background_tasks: Set[asyncio.Task] = set()
+        # Proactive refresher keeping the article list warm (0 = disabled)
+        self._refresh_interval = refresh_interval
+        self._refresh_jitter = refresh_jitter
+        self._refresher_task: Optional[asyncio.Task] = None
+        self._refresher_stats: Dict[str, Any] = {
+            "refreshes": 0,
+            "failures": 0,
+            "consecutive_failures": 0,
+            "last_refresh": None,
+            "last_duration_seconds": None,
+            "last_error": None,
+            "next_refresh": None,
+        }
+        # Bounded caches sharing one memory budget
+        self._cache_max_bytes = cache_max_bytes
+        self._cache_policy = cache_policy
+        self._cache_manager = CacheManager(cache_max_bytes, cache_policy)
+        # Results of upstream search queries, keyed by normalized query
+        self._search_cache_size = search_cache_size
+        self._search_cache_ttl = search_cache_ttl
+        self._search_cache = self._cache_manager.namespace("search", search_cache_ttl, search_cache_size)
+        # Parsed article content keyed by normalized URL, and URLs that returned 404
+        self._content_cache_size = content_cache_size
+        self._content_cache_ttl = content_cache_ttl
+        self._content_missing_ttl = content_missing_ttl
+        self._content_cache = self._cache_manager.namespace("content", content_cache_ttl, content_cache_size)
+        self._missing_content_cache = self._cache_manager.namespace(
+            "content_missing", content_missing_ttl, content_cache_size
+        )
+        # Disk tier behind the content cache (None = disabled)
+        self._content_store = ContentStore(content_store_path) if content_store_path else None
+        self._content_store_max_age = content_store_max_age
+        self._content_store_stats = {"hits": 0, "misses": 0, "writes": 0, "errors": 0}
+        # Limits of concurrent downloads in batch content requests, shared by all calls
+        self._content_concurrency = content_concurrency
+        self._content_per_host = content_per_host
+        self._reset_content_limits()
+        # Article pages are streamed, larger ones are rejected; optionally
+        # the download stops once the content container has closed
+        self._content_max_bytes = content_max_bytes
+        self._content_early_stop = content_early_stop
+        self._content_stats: Dict[str, int] = {
+            "pages_downloaded": 0,
+            "bytes_downloaded": 0,
+            "early_stops": 0,
+            "too_large": 0,
+        }
+        # Executor parsing article HTML off the event loop, created on first use
+        self._parse_executor = parse_executor
+        self._parse_workers = parse_workers
+        # Extractor in HTML_EXTRACTORS used to parse pages ("auto" = lxml when installed)
+        self._html_extractor = html_extractor
+        self._parse_pool: Optional[concurrent.futures.Executor] = None
+        self._parse_pool_kind: Optional[str] = None
+        self._parse_stats: Dict[str, Any] = {
+            "parsed": 0,
+            "parse_seconds": 0.0,
+            "fallbacks": 0,
+            "last_fallback_error": None,
+        }
+        # Snapshot of the last downloaded article list (None = disabled)
+        self._snapshot_path = snapshot_path
+        # Set when the list comes from a snapshot; it is then served
+        # (up to max_staleness) until the first successful download
+        self._serving_snapshot = False
+        self._snapshot_stats: Dict[str, Any] = {
+            "loaded_articles": 0,
+            "loaded_from": None,
+            "saves": 0,
+            "save_failures": 0,
+            "last_save": None,
+            "last_error": None,
+        }
+        # In-flight downloads keyed by cache key, shared by concurrent callers
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._stats: Dict[str, int] = {
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "upstream_fetches": 0,
+            "coalesced_requests": 0,
+            "stale_hits": 0,
+            "stale_if_error_hits": 0,
+            "background_refreshes": 0,
+            "background_refresh_failures": 0,
+            "not_modified_responses": 0,
+            "bytes_downloaded": 0,
+            # Wire size of responses with Content-Length; chunked ones are only counted
+            "bytes_transferred": 0,
+            "transfers_without_length": 0,
+            "bytes_saved": 0,
+        }
+        # Content coding of the last downloaded article list
+        self._last_content_encoding: Optional[str] = None
+        # HTTP validators (ETag, Last-Modified) of the cached article list
+        self._validators: Dict[str, Any] = {}
+        # Id-keyed article store merged on every refresh (see _ingest)
+        self._articles_by_key: Dict[Any, Article] = {}
+        self._first_seen: Dict[Any, datetime] = {}
+        # (first seen, key) pairs in ascending order, for "new since" queries
+        self._additions: List[Tuple[datetime, Any]] = []
+        self._last_delta: Dict[str, Any] = {"added": 0, "changed": 0, "removed": 0, "at": None}
+        # Inverted indexes: field -> normalized value -> article keys
+        self._indexes: Dict[str, Dict[Any, Set[Any]]] = {name: {} for name in self.INDEXED_FIELDS}
+        # Original category spellings with article counts, and their sorted list
+        self._category_counts: Dict[str, int] = {}
+        self._sorted_categories: Optional[List[str]] = None
+        # Full-text inverted index: term -> article key -> term frequency
+        self._text_index: Dict[str, Dict[Any, int]] = {}
+        self._doc_lengths: Dict[Any, int] = {}
+        self._total_doc_length = 0
+        # Terms of fetched article content, kept to re-index changed articles
+        self._content_terms: Dict[Any, Dict[str, int]] = {}
+        self._key_by_url: Dict[str, Any] = {}
+        # Trigram index over lowercase title, URL and slug: trigram -> article keys
+        # (None = not built yet, see _get_trigram_index)
+        self._trigram_index: Optional[Dict[str, Set[Any]]] = None
+        # Position of each article in the cached list, to keep its order
+        self._positions: Dict[Any, int] = {}
+        # Keys of dated articles sorted by (publication date ordinal, timestamp)
+        self._date_index_keys: List[Any] = []
+        self._date_index_sort_keys: List[Tuple[int, float]] = []
+    
+    def configure(self, **options: Any) -> None:
+        """
+        Updates client options
+        
+        Args:
+            **options: Option values, names as listed in CONFIG_OPTIONS
+        """
+        for name in options:
+            if name not in self.CONFIG_OPTIONS:
+                raise ValueError(f"Unknown option: {name}")
+        
+        values = {name: getattr(self, f"_{name}") for name in self.CONFIG_OPTIONS}
+        values.update(options)
+        if not (0 <= values["soft_ttl"] <= values["hard_ttl"] <= values["max_staleness"]):
+            raise ValueError("Cache TTLs must satisfy 0 <= soft_ttl <= hard_ttl <= max_staleness")
+        if values["refresh_interval"] < 0 or values["refresh_jitter"] < 0:
+            raise ValueError("Refresh interval and jitter cannot be negative")
+        if values["cache_policy"] not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy: {values['cache_policy']}")
+        if values["content_store_max_age"] < 0:
+            raise ValueError("Content store max age cannot be negative")
+        if values["content_max_bytes"] < 1:
+            raise ValueError("Content max bytes must be at least 1")
+        if values["content_concurrency"] < 1 or values["content_per_host"] < 1:
+            raise ValueError("Content concurrency limits must be at least 1")
+        if values["parse_executor"] not in self.PARSE_EXECUTORS:
+            raise ValueError(f"Unknown parse executor: {values['parse_executor']}")
+        if values["parse_workers"] is not None and values["parse_workers"] < 1:
+            raise ValueError("Parse workers must be at least 1")
+        resolve_extractor(values["html_extractor"])
+        if values["pool_limit"] < 0 or values["pool_limit_per_host"] < 0:
+            raise ValueError("Connection pool limits cannot be negative")
+        if min(values["keepalive_timeout"], values["dns_cache_ttl"]) < 0:
+            raise ValueError("Keep-alive timeout and DNS cache TTL cannot be negative")
+        if min(values["connect_timeout"], values["read_timeout"], values["total_timeout"]) <= 0:
+            raise ValueError("HTTP timeouts must be positive")
+        
+        for name, value in options.items():
+            setattr(self, f"_{name}", value)
+        
+        self._cache_manager.max_bytes = self._cache_max_bytes
+        self._cache_manager.policy = self._cache_policy
+        self._search_cache.max_entries = self._search_cache_size
+        self._search_cache.ttl = self._search_cache_ttl
+        self._content_cache.max_entries = self._content_cache_size
+        self._content_cache.ttl = self._content_cache_ttl
+        self._missing_content_cache.max_entries = self._content_cache_size
+        self._missing_content_cache.ttl = self._content_missing_ttl
+        if "parse_executor" in options or "parse_workers" in options:
+            self._shutdown_parse_pool()
+        if "content_concurrency" in options or "content_per_host" in options:
+            self._reset_content_limits()
+    
+    def _reset_content_limits(self) -> None:
+        """
+        Drops semaphores limiting concurrent content downloads
+        
+        They are created again on first use (binding them to the running
+        event loop on Python < 3.10). Downloads already holding the previous
+        semaphores finish under the old limits.
+        """
+        self._content_limit: Optional[asyncio.Semaphore] = None
+        self._content_host_limits: Dict[str, asyncio.Semaphore] = {}
+    
+    def _session_config(self) -> Tuple[Any, ...]:
+        """Returns options the HTTP session is created with"""
+        return (
+            self._pool_limit, self._pool_limit_per_host, self._keepalive_timeout,
+            self._dns_cache_ttl, self._happy_eyeballs, self._connect_timeout,
+            self._read_timeout, self._total_timeout,
+        )
+    
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        """Creates request tracing collecting connection pool statistics"""
+        trace_config = aiohttp.TraceConfig()
+        
+        def count(name: str) -> Callable[..., Awaitable[None]]:
+            async def on_event(session: Any, context: Any, params: Any) -> None:
+                self._pool_stats[name] += 1
+            return on_event
+        
+        async def on_queued_start(session: Any, context: Any, params: Any) -> None:
+            self._pool_stats["requests_queued"] += 1
+            context.queued_at = time.perf_counter()
+        
+        async def on_queued_end(session: Any, context: Any, params: Any) -> None:
+            self._pool_stats["queue_wait_seconds"] += time.perf_counter() - context.queued_at
+        
+        trace_config.on_request_start.append(count("requests"))
+        trace_config.on_request_exception.append(count("request_errors"))
+        trace_config.on_connection_create_end.append(count("connections_created"))
+        trace_config.on_connection_reuseconn.append(count("connections_reused"))
+        trace_config.on_connection_queued_start.append(on_queued_start)
+        trace_config.on_connection_queued_end.append(on_queued_end)
+        trace_config.on_dns_cache_hit.append(count("dns_cache_hits"))
+        trace_config.on_dns_cache_miss.append(count("dns_cache_misses"))
+        return trace_config
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Gets or creates HTTP session with the configured connection pool"""
+        config = self._session_config()
+        if self._session is not None and not self._session.closed and self._session_options != config:
+            self._retire_session(self._session)
+            self._session = None
+        
+        if self._session is None or self._session.closed:
+            connector_options: Dict[str, Any] = {
+                "limit": self._pool_limit,
+                "limit_per_host": self._pool_limit_per_host,
+                "keepalive_timeout": self._keepalive_timeout,
+                "use_dns_cache": self._dns_cache_ttl > 0,
+                "ttl_dns_cache": self._dns_cache_ttl or None,
+            }
+            if not self._happy_eyeballs:
+                # aiohttp >= 3.10, connects to addresses one at a time
+                connector_options["happy_eyeballs_delay"] = None
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(**connector_options),
+                timeout=aiohttp.ClientTimeout(
+                    total=self._total_timeout,
+                    connect=self._connect_timeout,
+                    sock_read=self._read_timeout,
+                ),
+                trace_configs=[self._trace_config()],
+            )
+            self._session_options = config
+            self._pool_stats["sessions_created"] += 1
+        return self._session
+    
+    def _retire_session(self, session: aiohttp.ClientSession) -> None:
+        """Closes replaced session once requests still using it have timed out"""
+        self._retired_sessions.add(session)
+        
+        async def _close() -> None:
+            await asyncio.sleep(self._total_timeout)
+            await session.close()
+            self._retired_sessions.discard(session)
+        
+        task = asyncio.ensure_future(_close())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    def start_refresher(self) -> None:
+        """Starts background task refreshing the article list on an interval"""
+        if self._refresh_interval <= 0:
+            return
+        if self._refresher_task is None or self._refresher_task.done():
+            self._refresher_task = asyncio.ensure_future(self._refresher_loop())
+    
+    async def stop_refresher(self) -> None:
+        """Stops background refresher task"""
+        task = self._refresher_task
+        self._refresher_task = None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    
+    async def _refresher_loop(self) -> None:
+        """Refreshes the article list immediately and then on a jittered interval"""
+        stats = self._refresher_stats
+        while True:
+            started = datetime.now()
+            try:
+                await self._coalesce("articles_all", self._download_articles)
+                stats["refreshes"] += 1
+                stats["consecutive_failures"] = 0
+                stats["last_refresh"] = started.isoformat()
+            except Exception as e:
+                stats["failures"] += 1
+                stats["consecutive_failures"] += 1
+                stats["last_error"] = str(e)
+            stats["last_duration_seconds"] = (datetime.now() - started).total_seconds()
+            
+            delay = self._refresh_interval + random.uniform(-self._refresh_jitter, self._refresh_jitter)
+            delay = max(1.0, delay)
+            stats["next_refresh"] = (datetime.now() + timedelta(seconds=delay)).isoformat()
+            await asyncio.sleep(delay)
+    
+    def open_content_store(self, path: str) -> None:
+        """
+        Opens disk store used as second tier of the content cache
+        
+        Args:
+            path: SQLite database file
+        """
+        if self._content_store is not None:
+            self._content_store.close()
+        self._content_store = ContentStore(path)
+    
+    async def close(self):
+        """Closes HTTP session"""
+        await self.stop_refresher()
+        for task in list(self._background_tasks) + list(self._inflight.values()):
+            task.cancel()
+        if self._session and not self._session.closed:
+            await self._session.close()
+        for session in list(self._retired_sessions):
+            await session.close()
+        self._retired_sessions.clear()
+        if self._content_store is not None:
+            self._content_store.close()
+            self._content_store = None
+        self._shutdown_parse_pool()
+    
+    def _get_parse_pool(self) -> Optional[concurrent.futures.Executor]:
+        """
+        Gets or creates executor for parsing article HTML
+        
+        Returns:
+            Executor, None when parsing runs inline on the event loop
+        """
+        if self._parse_pool is None and self._parse_executor != "inline":
+            if self._parse_executor == "process":
+                try:
+                    # Spawned workers do not inherit the event loop or open sockets
+                    self._parse_pool = concurrent.futures.ProcessPoolExecutor(
+                        max_workers=self._parse_workers,
+                        mp_context=multiprocessing.get_context("spawn")
+                    )
+                    self._parse_pool_kind = "process"
+                except (OSError, NotImplementedError, ValueError) as e:
+                    self._parse_stats["fallbacks"] += 1
+                    self._parse_stats["last_fallback_error"] = str(e)
+            if self._parse_pool is None:
+                self._parse_pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self._parse_workers, thread_name_prefix="awsblogs-parse"
+                )
+                self._parse_pool_kind = "thread"
+        return self._parse_pool
+    
+    def _shutdown_parse_pool(self) -> None:
+        """Shuts down parse executor, a new one is created on next use"""
+        pool = self._parse_pool
+        self._parse_pool = None
+        self._parse_pool_kind = None
+        if pool is not None:
+            pool.shutdown(wait=False)
+    
+    async def _parse_html(self, html_content: str) -> Dict[str, Any]:
+        """
+        Parses article HTML in the parse executor
+        
+        A broken process pool (e.g. worker killed) is replaced by a thread
+        pool and the page is parsed again.
+        
+        Args:
+            html_content: Page HTML
+            
+        Returns:
+            Parsed article fields, see parse_article_html
+        """
+        started = time.perf_counter()
+        pool = self._get_parse_pool()
+        if pool is None:
+            parsed = parse_article_html(html_content, self._html_extractor)
+        else:
+            loop = asyncio.get_running_loop()
+            try:
+                parsed = await loop.run_in_executor(
+                    pool, parse_article_html, html_content, self._html_extractor
+                )
+            except concurrent.futures.BrokenExecutor as e:
+                self._parse_stats["fallbacks"] += 1
+                self._parse_stats["last_fallback_error"] = str(e)
+                if self._parse_pool is pool:
+                    self._shutdown_parse_pool()
+                    self._parse_executor = "thread"
+                parsed = await loop.run_in_executor(
+                    self._get_parse_pool(), parse_article_html, html_content, self._html_extractor
+                )
+        self._parse_stats["parsed"] += 1
+        self._parse_stats["parse_seconds"] += time.perf_counter() - started
+        return parsed
+    
+    async def _coalesce(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Runs factory once per key and shares its result with concurrent callers
+        
+        Args:
+            key: Key identifying the operation (e.g. cache key)
+            factory: Coroutine function performing the operation
+            
+        Returns:
+            Result of the shared operation
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            self._stats["coalesced_requests"] += 1
+        else:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            
+            def _done(finished: asyncio.Future) -> None:
+                if self._inflight.get(key) is finished:
+                    del self._inflight[key]
+                # Mark exception as retrieved when every waiter has gone away
+                if not finished.cancelled():
+                    finished.exception()
+            
+            task.add_done_callback(_done)
+        
+        # Shield so that a cancelled caller does not cancel the shared download
+        return await asyncio.shield(task)
+    
+    async def _download_articles(self, search_query: Optional[str] = None) -> List[Article]:
+        """
+        Downloads article list from AWS News API and stores it in cache
+        
+        Args:
+            search_query: Search query for API filtering
+            
+        Returns:
+            List of articles
+        """
+        # Build search parameter if provided
+        url = self.BASE_URL
+        params = {"search": search_query} if search_query else None
+        
+        cache_key = f"articles_{search_query or 'all'}"
+        fetch_time = datetime.now()
+        session = await self._get_session()
+        self._stats["upstream_fetches"] += 1
+        
+        # Revalidate cached article list instead of downloading it again
+        headers = {}
+        if search_query is None and cache_key in self._cache:
+            if self._validators.get("etag"):
+                headers["If-None-Match"] = self._validators["etag"]
+            if self._validators.get("last_modified"):
+                headers["If-Modified-Since"] = self._validators["last_modified"]
+        
+        try:
+            request_headers = {"Accept-Encoding": ACCEPT_ENCODING, **headers}
+            async with session.get(url, params=params, headers=request_headers) as response:
+                if response.status == 304 and headers:
+                    self._stats["not_modified_responses"] += 1
+                    # Nothing is counted when the size on the wire was unknown (chunked response)
+                    self._stats["bytes_saved"] += self._validators.get("transfer_bytes") or 0
+                    self._last_fetch = fetch_time
+                    self._serving_snapshot = False
+                    return self._cache[cache_key]
+                elif response.status == 200:
+                    body = await response.read()
+                    self._stats["bytes_downloaded"] += len(body)
+                    # Content-Length is the size on the wire, before decompression
+                    if response.content_length is not None:
+                        self._stats["bytes_transferred"] += response.content_length
+                    else:
+                        self._stats["transfers_without_length"] += 1
+                    self._last_content_encoding = response.headers.get("Content-Encoding", "identity")
+                    data = decode_json(body)
+                    articles = data.get('articles', [])
+                    
+                    # Save to cache (search results are cached by fetch_articles)
+                    if search_query is None:
+                        articles = self._ingest(articles, fetch_time)
+                        self._validators = {
+                            "etag": response.headers.get("ETag"),
+                            "last_modified": response.headers.get("Last-Modified"),
+                            # Size on the wire, i.e. what a 304 answer saves (None = unknown)
+                            "transfer_bytes": response.content_length,
+                        }
+                        self._last_fetch = fetch_time
+                        self._serving_snapshot = False
+                        await self._save_snapshot(articles, fetch_time)
+                    else:
+                        articles = [Article(article) for article in articles]
+                    return articles
+                else:
+                    raise Exception(f"API error: {response.status}")
+        except asyncio.TimeoutError:
+            raise Exception(f"Error downloading data: timed out after {self._total_timeout} s")
+        except Exception as e:
+            raise Exception(f"Error downloading data: {e}")
+    
+    def _ingest(self, articles: List[Dict[str, Any]], fetch_time: datetime) -> List[Article]:
+        """
+        Merges downloaded article list into the id-keyed store
+        
+        Unchanged articles keep their existing records, so only new and
+        changed articles are normalized and derived structures only need
+        to be updated for the delta (see _apply_delta).
+        
+        Args:
+            articles: Downloaded list of articles
+            fetch_time: Time of the download
+            
+        Returns:
+            Cached article list in API order
+        """
+        old_store = self._articles_by_key
+        new_store: Dict[Any, Article] = {}
+        merged: List[Article] = []
+        added: List[Article] = []
+        changed: List[Tuple[Article, Article]] = []
+        
+        for data in articles:
+            key = data.get("id") or data.get("url")
+            if not key or key in new_store:
+                continue
+            existing = old_store.get(key)
+            if existing is not None and existing.same_source(data):
+                article = existing
+            else:
+                article = Article(data)
+                if existing is None:
+                    added.append(article)
+                else:
+                    changed.append((existing, article))
+            new_store[key] = article
+            merged.append(article)
+        
+        removed = [article for key, article in old_store.items() if key not in new_store]
+        
+        self._articles_by_key = new_store
+        self._cache["articles_all"] = merged
+        self._positions = {article.key: pos for pos, article in enumerate(merged)}
+        self._apply_delta(added, changed, removed, fetch_time)
+        self._last_delta = {
+            "added": len(added),
+            "changed": len(changed),
+            "removed": len(removed),
+            "at": fetch_time.isoformat(),
+        }
+        return merged
+    
+    def _apply_delta(self, added: List[Article],
+                     changed: List[Tuple[Article, Article]],
+                     removed: List[Article], fetch_time: datetime) -> None:
+        """
+        Updates structures derived from the article store
+        
+        Args:
+            added: New articles
+            changed: (old, new) pairs of modified articles
+            removed: Articles no longer present in the API
+            fetch_time: Time of the download
+        """
+        self._update_date_index(added, changed, removed)
+        self._update_indexes(added, changed, removed)
+        self._update_text_index(added, changed, removed)
+        self._update_trigram_index(added, changed, removed)
+        
+        # The very first list is a baseline, not a batch of new articles
+        baseline = len(added) == len(self._articles_by_key) and not changed and not removed
+        for article in added:
+            key = article.key
+            self._first_seen[key] = fetch_time
+            if not baseline:
+                self._additions.append((fetch_time, key))
+        
+        if removed:
+            removed_keys = {article.key for article in removed}
+            for key in removed_keys:
+                self._first_seen.pop(key, None)
+            self._additions = [item for item in self._additions if item[1] not in removed_keys]
+    
+    # BM25 parameters
+    BM25_K1 = 1.2
+    BM25_B = 0.75
+    
+    TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+    
+    @classmethod
+    def _tokenize(cls, text: str) -> List[str]:
+        """Splits text into lowercase alphanumeric terms (single characters dropped)"""
+        return [term for term in cls.TOKEN_PATTERN.findall(text.lower()) if len(term) > 1]
+    
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        """Normalizes article URL for lookups (scheme/host case, fragment, tracking parameters, trailing slash)"""
+        parts = urlsplit(url.strip())
+        query = urlencode([
+            (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not name.lower().startswith("utm_")
+        ])
+        path = parts.path.rstrip("/") or "/"
+        return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+    
+    def _document_terms(self, key: Any, article: Article) -> Dict[str, int]:
+        """Returns term frequencies of article title, slug, category and fetched content"""
+        terms: Dict[str, int] = {}
+        for text in (article.title, article.slug, article.main_category):
+            for term in self._tokenize(text):
+                terms[term] = terms.get(term, 0) + 1
+        for term, count in self._content_terms.get(key, {}).items():
+            terms[term] = terms.get(term, 0) + count
+        return terms
+    
+    def _index_document(self, key: Any, article: Article) -> None:
+        """Adds article to the full-text index"""
+        terms = self._document_terms(key, article)
+        for term, count in terms.items():
+            self._text_index.setdefault(term, {})[key] = count
+        length = sum(terms.values())
+        self._doc_lengths[key] = length
+        self._total_doc_length += length
+    
+    def _unindex_document(self, key: Any, article: Article) -> None:
+        """Removes article from the full-text index"""
+        for term in self._document_terms(key, article):
+            postings = self._text_index.get(term)
+            if postings is not None:
+                postings.pop(key, None)
+                if not postings:
+                    del self._text_index[term]
+        self._total_doc_length -= self._doc_lengths.pop(key, 0)
+    
+    def _update_text_index(self, added: List[Article],
+                           changed: List[Tuple[Article, Article]],
+                           removed: List[Article]) -> None:
+        """Updates full-text index and URL lookup for a delta"""
+        for article in removed + [old for old, _ in changed]:
+            self._unindex_document(article.key, article)
+            self._key_by_url.pop(self._normalize_url(article.url), None)
+        for article in removed:
+            self._content_terms.pop(article.key, None)
+        
+        for article in added + [new for _, new in changed]:
+            self._index_document(article.key, article)
+            if article.url:
+                self._key_by_url[self._normalize_url(article.url)] = article.key
+    
+    def _index_content(self, url: str, content: str) -> None:
+        """Adds fetched article content to the full-text index of the matching article"""
+        key = self._key_by_url.get(self._normalize_url(url))
+        if key is None:
+            return
+        article = self._articles_by_key[key]
+        
+        terms: Dict[str, int] = {}
+        for term in self._tokenize(content):
+            terms[term] = terms.get(term, 0) + 1
+        
+        self._unindex_document(key, article)
+        self._content_terms[key] = terms
+        self._index_document(key, article)
+    
+    def _text_match_keys(self, text: str) -> Set[Any]:
+        """Returns keys of cached articles containing every term of full-text query"""
+        postings = []
+        for term in set(self._tokenize(text)):
+            keys = self._text_index.get(term)
+            if not keys:
+                return set()
+            postings.append(keys)
+        if not postings:
+            return set()
+        
+        postings.sort(key=len)
+        matched = set(postings[0])
+        for keys in postings[1:]:
+            matched.intersection_update(keys)
+            if not matched:
+                break
+        return matched
+    
+    def _bm25_scores(self, text: str) -> Dict[Any, float]:
+        """
+        Scores cached articles against full-text query with BM25
+        
+        Only articles containing every query term are scored, so a single
+        common term ("aws", a service name) does not make a query match.
+        
+        Args:
+            text: Query text
+            
+        Returns:
+            Dict of article key -> score for articles containing all query terms
+        """
+        doc_count = len(self._doc_lengths)
+        matched = self._text_match_keys(text)
+        if not doc_count or not matched:
+            return {}
+        avg_length = self._total_doc_length / doc_count or 1.0
+        k1, b = self.BM25_K1, self.BM25_B
+        
+        scores: Dict[Any, float] = dict.fromkeys(matched, 0.0)
+        for term in set(self._tokenize(text)):
+            postings = self._text_index[term]
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for key in matched:
+                frequency = postings[key]
+                norm = k1 * (1 - b + b * self._doc_lengths[key] / avg_length)
+                scores[key] += idf * frequency * (k1 + 1) / (frequency + norm)
+        return scores
+    
+    @staticmethod
+    def _trigrams(text: str) -> Set[str]:
+        """Returns set of 3-character substrings of text"""
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+    
+    @classmethod
+    def _article_trigrams(cls, article: Article) -> Set[str]:
+        """Returns trigrams of lowercase title, URL and slug (fields kept apart)"""
+        return cls._trigrams("\x00".join((article.title, article.url, article.slug)).lower())
+    
+    def _update_trigram_index(self, added: List[Article],
+                              changed: List[Tuple[Article, Article]],
+                              removed: List[Article]) -> None:
+        """Updates trigram index for a delta (once the index has been built)"""
+        if self._trigram_index is None:
+            return
+        
+        for article in removed + [old for old, _ in changed]:
+            for trigram in self._article_trigrams(article):
+                postings = self._trigram_index.get(trigram)
+                if postings is not None:
+                    postings.discard(article.key)
+                    if not postings:
+                        del self._trigram_index[trigram]
+        
+        for article in added + [new for _, new in changed]:
+            for trigram in self._article_trigrams(article):
+                self._trigram_index.setdefault(trigram, set()).add(article.key)
+    
+    def _get_trigram_index(self) -> Dict[str, Set[Any]]:
+        """
+        Returns trigram index, building it over the store on first use
+        
+        Only substring search needs the index, so it is not built (and kept
+        up to date) until the first search_articles call or text query.
+        """
+        if self._trigram_index is None:
+            index: Dict[str, Set[Any]] = {}
+            for key, article in self._articles_by_key.items():
+                for trigram in self._article_trigrams(article):
+                    index.setdefault(trigram, set()).add(key)
+            self._trigram_index = index
+        return self._trigram_index
+    
+    def _trigram_candidates(self, query_lower: str) -> Optional[Set[Any]]:
+        """
+        Finds keys of articles that may contain query in title, URL or slug
+        
+        Candidates still have to be verified with _matches_text.
+        
+        Args:
+            query_lower: Lowercase query
+            
+        Returns:
+            Candidate keys, None if query is too short for the index
+        """
+        if len(query_lower) < 3:
+            return None
+        
+        index = self._get_trigram_index()
+        postings = []
+        for trigram in self._trigrams(query_lower):
+            keys = index.get(trigram)
+            if not keys:
+                return set()
+            postings.append(keys)
+        
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for keys in postings[1:]:
+            candidates &= keys
+            if not candidates:
+                break
+        return candidates
+    
+    def _update_indexes(self, added: List[Article],
+                        changed: List[Tuple[Article, Article]],
+                        removed: List[Article]) -> None:
+        """Updates inverted field indexes and category counts for a delta"""
+        for article in removed + [old for old, _ in changed]:
+            for name, extract in self.INDEXED_FIELDS.items():
+                value = extract(article)
+                postings = self._indexes[name].get(value)
+                if postings is not None:
+                    postings.discard(article.key)
+                    if not postings:
+                        del self._indexes[name][value]
+            category = article.main_category
+            if category:
+                self._category_counts[category] -= 1
+                if not self._category_counts[category]:
+                    del self._category_counts[category]
+        
+        for article in added + [new for _, new in changed]:
+            for name, extract in self.INDEXED_FIELDS.items():
+                self._indexes[name].setdefault(extract(article), set()).add(article.key)
+            category = article.main_category
+            if category:
+                self._category_counts[category] = self._category_counts.get(category, 0) + 1
+        
+        self._sorted_categories = None
+    
+    def _filter_indexed(self, articles: List[Article], field: str, value: Any) -> List[Article]:
+        """
+        Filters articles by normalized field value using inverted index
+        
+        Articles not in the store (e.g. upstream search results) are checked directly.
+        
+        Args:
+            articles: List of articles
+            field: Name of field in INDEXED_FIELDS
+            value: Normalized value
+            
+        Returns:
+            Filtered articles in input order
+        """
+        extract = self.INDEXED_FIELDS[field]
+        postings = self._indexes[field].get(value, ())
+        store = self._articles_by_key
+        
+        filtered = []
+        for article in articles:
+            if store.get(article.key) is article:
+                if article.key in postings:
+                    filtered.append(article)
+            elif extract(article) == value:
+                filtered.append(article)
+        return filtered
+    
+    # Deltas larger than this rebuild the date index instead of patching it
+    DATE_INDEX_REBUILD_THRESHOLD = 64
+    
+    def _update_date_index(self, added: List[Article],
+                           changed: List[Tuple[Article, Article]],
+                           removed: List[Article]) -> None:
+        """Updates date-sorted index for a delta (expects the store to be updated)"""
+        outdated = removed + [old for old, _ in changed]
+        current = added + [new for _, new in changed]
+        
+        if len(outdated) + len(current) > self.DATE_INDEX_REBUILD_THRESHOLD:
+            entries = sorted(
+                (self._date_sort_key(article.published_at), key)
+                for key, article in self._articles_by_key.items()
+                if article.published_at is not None
+            )
+            self._date_index_sort_keys = [sort_key for sort_key, _ in entries]
+            self._date_index_keys = [key for _, key in entries]
+            return
+        
+        for article in outdated:
+            key = article.key
+            published = article.published_at
+            if published is None:
+                continue
+            sort_key = self._date_sort_key(published)
+            lo = bisect.bisect_left(self._date_index_sort_keys, sort_key)
+            hi = bisect.bisect_right(self._date_index_sort_keys, sort_key)
+            for pos in range(lo, hi):
+                if self._date_index_keys[pos] == key:
+                    del self._date_index_keys[pos]
+                    del self._date_index_sort_keys[pos]
+                    break
+        
+        for article in current:
+            if article.published_at is None:
+                continue
+            sort_key = self._date_sort_key(article.published_at)
+            pos = bisect.bisect_right(self._date_index_sort_keys, sort_key)
+            self._date_index_sort_keys.insert(pos, sort_key)
+            self._date_index_keys.insert(pos, article.key)
+    
+    @staticmethod
+    def _date_sort_key(published: datetime) -> Tuple[int, float]:
+        """Returns sort key ordering articles by publication date, then time"""
+        if published.tzinfo is None:
+            timestamp = published.replace(tzinfo=timezone.utc).timestamp()
+        else:
+            timestamp = published.timestamp()
+        return (published.date().toordinal(), timestamp)
+    
+    def _newest_first(self, articles: List[Article]) -> List[Article]:
+        """Sorts dated articles newest first, dropping articles without valid date"""
+        dated = []
+        for article in articles:
+            if article.published_at is not None:
+                dated.append((self._date_sort_key(article.published_at), article))
+        dated.sort(key=lambda item: item[0], reverse=True)
+        return [article for _, article in dated]
+    
+    def _date_index_range(self, from_dt: Optional[date], to_dt: Optional[date]) -> Tuple[int, int]:
+        """Resolves date range to [start, end) positions in the date index by binary search"""
+        sort_keys = self._date_index_sort_keys
+        start = bisect.bisect_left(sort_keys, (from_dt.toordinal(),)) if from_dt else 0
+        end = bisect.bisect_left(sort_keys, (to_dt.toordinal() + 1,)) if to_dt else len(sort_keys)
+        return start, end
+    
+    def _iter_date_range(self, from_dt: Optional[date], to_dt: Optional[date]) -> Iterator[Article]:
+        """Lazily yields stored articles within date range, newest first"""
+        start, end = self._date_index_range(from_dt, to_dt)
+        store = self._articles_by_key
+        keys = self._date_index_keys
+        for pos in range(end - 1, start - 1, -1):
+            yield store[keys[pos]]
+    
+    def _date_range_from_index(self, from_dt: Optional[date], to_dt: Optional[date]) -> List[Article]:
+        """Resolves date range over the whole store by binary search (newest first)"""
+        start, end = self._date_index_range(from_dt, to_dt)
+        store = self._articles_by_key
+        return [store[key] for key in reversed(self._date_index_keys[start:end])]
+    
+    def get_articles_added_since(self, since: datetime) -> List[Article]:
+        """
+        Gets articles that appeared in the API since a given time
+        
+        Args:
+            since: Time the articles were first seen at or after
+            
+        Returns:
+            Articles in order they were first seen (newest first)
+        """
+        # A 1-tuple sorts before every (since, key) pair with the same time
+        start = bisect.bisect_left(self._additions, (since,))
+        return [
+            self._articles_by_key[key]
+            for _, key in reversed(self._additions[start:])
+        ]
     
-    # Available AWS blog categories
-    AVAILABLE_CATEGORIES = [
-        "Architecture",
-        "AWS Cloud Operations", 
-        "AWS for Games",
-        "AWS Insights",
-        "AWS Marketplace",
-        "AWS News",
-        "AWS Partner Network",
-        "AWS Smart Business",
-        "Big Data",
-        "Business Intelligence",
-        "Business Productivity",
-        "Cloud Enterprise Strategy",
-        "Cloud Financial Management",
-        "Compute",
-        "Contact Center",
-        "Containers",
-        "Database",
-        "Desktop & Application Streaming",
-        "Developer Tools",
-        "DevOps & Developer Productivity",
-        "Front-End Web & Mobile",
-        "HPC",
-        "IBM and Red Hat",
-        "Industries",
-        "Integration & Automation",
-        "Internet of Things",
-        "Machine Learning",
-        "Media",
-        "Messaging & Targeting",
-        "Microsoft Workloads on AWS",
-        "Migration and Modernization",
-        ".NET on AWS",
-        "Networking & Content Delivery",
-        "Open Source",
-        "Public Sector",
-        "Quantum Computing",
-        "SAP",
-        "Security",
-        "Spatial Computing",
-        "Startups",
-        "Storage",
-        "Supply Chain & Logistics",
-        "Training & Certification"
-    ]
+    def _cache_age(self) -> Optional[float]:
+        """Returns age of the cached article list in seconds (None = not cached)"""
+        if self._last_fetch is None or "articles_all" not in self._cache:
+            return None
+        return (datetime.now() - self._last_fetch).total_seconds()
     
-    def __init__(self):
-        self._session: Optional[aiohttp.ClientSession] = None
-        self._cache: Dict[str, Any] = {}
-        self._cache_timeout = 300  # 5 minutes cache
-        self._last_fetch = None
+    def _schedule_refresh(self) -> None:
+        """Starts background refresh of the article list unless one is running"""
+        if "articles_all" in self._inflight:
+            return
+        
+        async def _refresh() -> None:
+            self._stats["background_refreshes"] += 1
+            try:
+                await self._coalesce("articles_all", self._download_articles)
+            except Exception:
+                self._stats["background_refresh_failures"] += 1
+        
+        task = asyncio.ensure_future(_refresh())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
     
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Gets or creates HTTP session"""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
-        return self._session
+    def load_snapshot(self) -> bool:
+        """
+        Loads article list from the snapshot file into cache
+        
+        The loaded list is served immediately (see _serving_snapshot) while
+        the regular refresh replaces it.
+        
+        Returns:
+            True if snapshot was loaded
+        """
+        if not self._snapshot_path or not os.path.exists(self._snapshot_path):
+            return False
+        
+        try:
+            with open(self._snapshot_path, "rb") as f:
+                raw = f.read()
+            if not raw.startswith(self.SNAPSHOT_MAGIC):
+                raise ValueError("unknown snapshot format")
+            data = decode_json(zlib.decompress(raw[len(self.SNAPSHOT_MAGIC):]))
+            articles = data["articles"]
+            saved_at = datetime.fromisoformat(data["saved_at"])
+            validators = data.get("validators") or {}
+        except (OSError, ValueError, KeyError, TypeError, zlib.error) as e:
+            self._snapshot_stats["last_error"] = f"Error loading snapshot: {e}"
+            return False
+        
+        self._ingest(articles, saved_at)
+        self._validators = validators
+        self._last_fetch = saved_at
+        self._serving_snapshot = True
+        self._snapshot_stats["loaded_articles"] = len(articles)
+        self._snapshot_stats["loaded_from"] = saved_at.isoformat()
+        return True
     
-    async def close(self):
-        """Closes HTTP session"""
-        if self._session and not self._session.closed:
-            await self._session.close()
+    def _write_snapshot(self, payload: bytes) -> None:
+        """Atomically writes snapshot payload to the snapshot file"""
+        directory = os.path.dirname(os.path.abspath(self._snapshot_path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self._snapshot_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(self.SNAPSHOT_MAGIC)
+            f.write(payload)
+        os.replace(tmp_path, self._snapshot_path)
+    
+    async def _save_snapshot(self, articles: List[Article], fetch_time: datetime) -> None:
+        """Saves article list to the snapshot file without blocking the event loop"""
+        if not self._snapshot_path:
+            return
+        
+        data = {
+            "saved_at": fetch_time.isoformat(),
+            "validators": self._validators,
+            "articles": [article.to_dict() for article in articles],
+        }
+        
+        def _encode_and_write() -> None:
+            payload = zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+            self._write_snapshot(payload)
+        
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, _encode_and_write)
+            self._snapshot_stats["saves"] += 1
+            self._snapshot_stats["last_save"] = fetch_time.isoformat()
+        except (OSError, ValueError, TypeError) as e:
+            self._snapshot_stats["save_failures"] += 1
+            self._snapshot_stats["last_error"] = f"Error saving snapshot: {e}"
+    
+    @staticmethod
+    def _normalize_search_query(search_query: str) -> str:
+        """Normalizes search query for caching (case, whitespace)"""
+        return " ".join(search_query.lower().split())
     
-    async def fetch_articles(self, limit: Optional[int] = None, search_query: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def fetch_articles(self, limit: Optional[int] = None, search_query: Optional[str] = None) -> List[Article]:
         """
         Downloads articles from AWS News API
         
+        The article list follows stale-while-revalidate policy (see __init__),
+        search results are kept in a bounded LRU cache with TTL.
+        Concurrent cache misses for the same key share a single download.
+        
         Args:
             limit: Maximum number of articles (None = all available)
             search_query: Search query for API filtering
@@ -94,37 +2190,39 @@ class AWSNewsAPI:
         Returns:
             List of articles
         """
-        # For search queries, always fetch fresh data (don't use cache)
-        current_time = datetime.now()
         cache_key = f"articles_{search_query or 'all'}"
         
-        if (search_query is None and self._last_fetch and 
-            (current_time - self._last_fetch).total_seconds() < self._cache_timeout and
-            cache_key in self._cache):
-            articles = self._cache[cache_key]
+        # Search results come from a bounded LRU cache with TTL; the normalized
+        # query only keys the cache, the API receives the query as given
+        if search_query:
+            normalized = self._normalize_search_query(search_query)
+            articles = self._search_cache.get(normalized)
+            if articles is None:
+                articles = await self._coalesce(
+                    f"articles_search_{normalized}", lambda: self._download_articles(search_query)
+                )
+                self._search_cache.set(normalized, articles)
         else:
-            # Build URL with search parameter if provided
-            url = self.BASE_URL
-            if search_query:
-                url += f"?search={search_query}"
-            
-            # Download new data
-            session = await self._get_session()
+            age = self._cache_age()
             
-            try:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        articles = data.get('articles', [])
-                        
-                        # Save to cache
-                        self._cache[cache_key] = articles
-                        if search_query is None:
-                            self._last_fetch = current_time
-                    else:
-                        raise Exception(f"API error: {response.status}")
-            except Exception as e:
-                raise Exception(f"Error downloading data: {e}")
+            if age is not None and age < self._soft_ttl:
+                self._stats["cache_hits"] += 1
+                articles = self._cache[cache_key]
+            elif age is not None and (age < self._hard_ttl or
+                                      (self._serving_snapshot and age < self._max_staleness)):
+                # Serve stale list immediately, refresh in background
+                self._stats["stale_hits"] += 1
+                articles = self._cache[cache_key]
+                self._schedule_refresh()
+            else:
+                self._stats["cache_misses"] += 1
+                try:
+                    articles = await self._coalesce(cache_key, self._download_articles)
+                except Exception:
+                    if age is None or age >= self._max_staleness:
+                        raise
+                    self._stats["stale_if_error_hits"] += 1
+                    articles = self._cache[cache_key]
         
         # Apply limit
         if limit and limit > 0:
@@ -132,7 +2230,90 @@ class AWSNewsAPI:
             
         return articles
     
-    def filter_by_type(self, articles: List[Dict[str, Any]], article_type: str) -> List[Dict[str, Any]]:
+    def get_cache_stats(self, include_entries: bool = False) -> Dict[str, Any]:
+        """
+        Gets memory usage of client caches
+        
+        Args:
+            include_entries: Include per-entry details of bounded caches
+            
+        Returns:
+            Dict with bounded cache statistics and size of the cached article list
+        """
+        stats = self._cache_manager.stats(include_entries)
+        stats["article_list"] = {
+            "entries": len(self._articles_by_key),
+            "estimated_bytes": estimate_size(self._cache.get("articles_all", [])),
+            "evictable": False,
+        }
+        return stats
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Gets client statistics
+        
+        Returns:
+            Dict with cache and upstream fetch counters
+        """
+        return {
+            "articles": {
+                **self._stats,
+                "inflight_fetches": len(self._inflight),
+                "cached_articles": len(self._cache.get("articles_all", [])),
+                "last_fetch": self._last_fetch.isoformat() if self._last_fetch else None,
+                "cache_age_seconds": self._cache_age(),
+                "last_delta": self._last_delta,
+                "etag": self._validators.get("etag"),
+                "accept_encoding": ACCEPT_ENCODING,
+                "last_content_encoding": self._last_content_encoding,
+                "json_decoder": JSON_DECODER,
+                "last_modified": self._validators.get("last_modified"),
+            },
+            "refresher": {
+                **self._refresher_stats,
+                "running": self._refresher_task is not None and not self._refresher_task.done(),
+                "interval_seconds": self._refresh_interval,
+                "jitter_seconds": self._refresh_jitter,
+            },
+            "caches": self.get_cache_stats(),
+            "parser": {
+                **self._parse_stats,
+                "parse_seconds": round(self._parse_stats["parse_seconds"], 3),
+                "executor": self._parse_pool_kind or self._parse_executor,
+                "workers": self._parse_workers,
+                "extractor": resolve_extractor(self._html_extractor),
+            },
+            "connection_pool": {
+                **self._pool_stats,
+                "queue_wait_seconds": round(self._pool_stats["queue_wait_seconds"], 3),
+                "limit": self._pool_limit,
+                "limit_per_host": self._pool_limit_per_host,
+                "keepalive_timeout": self._keepalive_timeout,
+                "dns_cache_ttl": self._dns_cache_ttl,
+                "happy_eyeballs": self._happy_eyeballs,
+                "timeouts": {
+                    "connect": self._connect_timeout,
+                    "read": self._read_timeout,
+                    "total": self._total_timeout,
+                },
+            },
+            "content": {
+                **self._content_stats,
+                "max_bytes": self._content_max_bytes,
+                "early_stop": self._content_early_stop,
+            },
+            "content_store": {
+                **self._content_store_stats,
+                **(self._content_store.stats() if self._content_store else {"path": None}),
+            },
+            "snapshot": {
+                **self._snapshot_stats,
+                "path": self._snapshot_path,
+                "serving_snapshot": self._serving_snapshot,
+            }
+        }
+    
+    def filter_by_type(self, articles: List[Article], article_type: str) -> List[Article]:
         """
         Filters articles by type
         
@@ -146,12 +2327,9 @@ class AWSNewsAPI:
         if article_type.lower() == "both":
             return articles
         
-        return [
-            article for article in articles 
-            if article.get("type", "").lower() == article_type.lower()
-        ]
+        return self._filter_indexed(articles, "type", article_type.lower())
     
-    def filter_by_category(self, articles: List[Dict[str, Any]], category: str) -> List[Dict[str, Any]]:
+    def filter_by_category(self, articles: List[Article], category: str) -> List[Article]:
         """
         Filters articles by main category
         
@@ -162,15 +2340,36 @@ class AWSNewsAPI:
         Returns:
             Filtered articles
         """
-        return [
-            article for article in articles 
-            if article.get("main_category", "").lower() == category.lower()
-        ]
+        return self._filter_indexed(articles, "category", category.lower())
+    
+    def filter_popular(self, articles: List[Article]) -> List[Article]:
+        """
+        Filters articles marked as popular
+        
+        Args:
+            articles: List of articles
+            
+        Returns:
+            Popular articles
+        """
+        return self._filter_indexed(articles, "popular", True)
+    
+    def filter_regional_expansions(self, articles: List[Article]) -> List[Article]:
+        """
+        Filters articles announcing regional expansions
+        
+        Args:
+            articles: List of articles
+            
+        Returns:
+            Regional expansion articles
+        """
+        return self._filter_indexed(articles, "regional_expansion", True)
     
-    def filter_by_date_range(self, articles: List[Dict[str, Any]], 
+    def filter_by_date_range(self, articles: List[Article], 
                            from_date: Optional[str] = None, 
                            to_date: Optional[str] = None,
-                           days_back: Optional[int] = None) -> List[Dict[str, Any]]:
+                           days_back: Optional[int] = None) -> List[Article]:
         """
         Filters articles by date range
         
@@ -181,42 +2380,36 @@ class AWSNewsAPI:
             days_back: Number of days back from today
             
         Returns:
-            Filtered articles
+            Filtered articles, newest first
         """
         if days_back:
             from_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
-            
+        
+        from_dt = datetime.strptime(from_date, "%Y-%m-%d").date() if from_date else None
+        to_dt = datetime.strptime(to_date, "%Y-%m-%d").date() if to_date else None
+        
+        # Whole cached list is answered from the date-sorted index
+        if articles is self._cache.get("articles_all"):
+            return self._date_range_from_index(from_dt, to_dt)
+        
         filtered = []
         for article in articles:
-            article_date_str = article.get("published_date", "")
-            if not article_date_str:
+            # Publication time is parsed at ingest, skip articles without valid date
+            published = article.published_at
+            if published is None:
                 continue
-                
-            try:
-                # Parse ISO 8601 datetime string
-                article_date = date_parser.parse(article_date_str).date()
-                
-                # Check from_date
-                if from_date:
-                    from_dt = datetime.strptime(from_date, "%Y-%m-%d").date()
-                    if article_date < from_dt:
-                        continue
-                
-                # Check to_date
-                if to_date:
-                    to_dt = datetime.strptime(to_date, "%Y-%m-%d").date()
-                    if article_date > to_dt:
-                        continue
-                
-                filtered.append(article)
-                
-            except (ValueError, TypeError):
-                # If unable to parse date, skip the article
+            
+            article_date = published.date()
+            if from_dt and article_date < from_dt:
+                continue
+            if to_dt and article_date > to_dt:
                 continue
+            
+            filtered.append(article)
         
-        return filtered
+        return self._newest_first(filtered)
     
-    def filter_todays_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def filter_todays_articles(self, articles: List[Article]) -> List[Article]:
         """
         Filters articles published today
         
@@ -224,12 +2417,19 @@ class AWSNewsAPI:
             articles: List of articles
             
         Returns:
-            Today's articles
+            Today's articles, newest first
         """
         today = datetime.now().date()
         return self.filter_by_date_range(articles, from_date=today.strftime("%Y-%m-%d"))
     
-    def search_articles(self, articles: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _matches_text(article: Article, query_lower: str) -> bool:
+        """Checks whether lowercase query is contained in title, URL or slug"""
+        return (query_lower in article.title.lower() or
+                query_lower in article.url.lower() or
+                query_lower in article.slug.lower())
+    
+    def search_articles(self, articles: List[Article], query: str) -> List[Article]:
         """
         Searches articles by text in title or URL
         
@@ -241,15 +2441,34 @@ class AWSNewsAPI:
             Found articles
         """
         query_lower = query.lower()
+        candidates = self._trigram_candidates(query_lower)
         
-        return [
-            article for article in articles
-            if (query_lower in article.get("title", "").lower() or
-                query_lower in article.get("url", "").lower() or
-                query_lower in article.get("slug", "").lower())
-        ]
+        if candidates is None:
+            return [
+                article for article in articles
+                if self._matches_text(article, query_lower)
+            ]
+        
+        store = self._articles_by_key
+        
+        # Whole cached list: verify only trigram candidates, in list order
+        if articles is self._cache.get("articles_all"):
+            keys = sorted(candidates, key=self._positions.__getitem__)
+            return [
+                store[key] for key in keys
+                if self._matches_text(store[key], query_lower)
+            ]
+        
+        found = []
+        for article in articles:
+            key = article.key
+            if store.get(key) is article and key not in candidates:
+                continue
+            if self._matches_text(article, query_lower):
+                found.append(article)
+        return found
     
-    def get_available_categories(self, articles: List[Dict[str, Any]]) -> List[str]:
+    def get_available_categories(self, articles: List[Article]) -> List[str]:
         """
         Gets list of available categories
         
@@ -259,18 +2478,382 @@ class AWSNewsAPI:
         Returns:
             List of unique categories
         """
+        # Whole cached list is answered from the category index
+        if articles is self._cache.get("articles_all"):
+            if self._sorted_categories is None:
+                self._sorted_categories = sorted(self._category_counts)
+            return list(self._sorted_categories)
+        
         categories = set()
         for article in articles:
-            category = article.get("main_category")
-            if category:
-                categories.add(category)
+            if article.main_category:
+                categories.add(article.main_category)
         
         return sorted(list(categories))
     
+    # Relative cost of sorting one candidate (per log2 level) versus checking it
+    PLAN_SORT_COST = 0.1
+    
+    @staticmethod
+    def _query_constraints(query: ArticleQuery) -> List[Tuple[str, Any]]:
+        """Returns index constraints of query as (field, normalized value) pairs"""
+        constraints = []
+        if query.article_type.lower() != "both":
+            constraints.append(("type", query.article_type.lower()))
+        if query.category:
+            constraints.append(("category", query.category.lower()))
+        if query.popular_only:
+            constraints.append(("popular", True))
+        return constraints
+    
+    def _plan(self, query: ArticleQuery) -> Dict[str, Any]:
+        """
+        Chooses evaluation order of query over the cached articles
+        
+        Every access path (date index range, posting list of a constraint,
+        trigram candidates of text filter) is costed from index cardinalities,
+        assuming independent filters. Walking the date index needs no sort and
+        stops at limit; driving from a key set needs its candidates sorted.
+        Key sets of the paths are kept under "keys" for evaluation.
+        
+        Args:
+            query: Query to plan
+            
+        Returns:
+            Plan with chosen driver, residual filter order and cost estimates
+        """
+        from_dt, to_dt = query.date_bounds()
+        total = max(len(self._articles_by_key), 1)
+        start, end = self._date_index_range(from_dt, to_dt)
+        # An inverted range (from after to) resolves to end < start
+        date_rows = max(end - start, 0)
+        limit = query.limit if query.limit and query.limit > 0 else None
+        
+        paths = [{"access": "date_index", "field": "published_date", "rows": date_rows}]
+        if query.match:
+            matched = self._text_match_keys(query.match)
+            paths.append({"access": "text_index", "field": "text", "value": query.match, "keys": matched})
+        for field, value in self._query_constraints(query):
+            paths.append({
+                "access": "posting_list",
+                "field": field,
+                "value": value,
+                "keys": self._indexes[field].get(value, ()),
+            })
+        if query.text:
+            candidates = self._trigram_candidates(query.text.lower())
+            if candidates is not None:
+                paths.append({"access": "trigram_index", "field": "text", "value": query.text, "keys": candidates})
+        for path in paths[1:]:
+            path["rows"] = len(path["keys"])
+        
+        for path in paths:
+            others = [other for other in paths if other is not path]
+            selectivity = 1.0
+            for other in others:
+                selectivity *= other["rows"] / total
+            path["estimated_matches"] = path["rows"] * selectivity
+            
+            if path["access"] == "date_index":
+                # Newest-first walk stops after limit matches
+                scanned = path["rows"]
+                if limit is not None and selectivity > 0:
+                    scanned = min(scanned, limit / selectivity)
+                path["cost"] = scanned
+            else:
+                # Only candidates passing the filters need sorting
+                matches = max(path["estimated_matches"], 0.0)
+                path["cost"] = path["rows"] + self.PLAN_SORT_COST * matches * math.log2(matches + 1)
+        
+        if query.match:
+            # Full-text matches have to be scored anyway, so they always drive
+            driver = next(path for path in paths if path["access"] == "text_index")
+        else:
+            driver = min(paths, key=lambda path: (path["cost"], path["access"] != "date_index"))
+        residual = sorted(
+            (path for path in paths if path is not driver and path["access"] != "date_index"),
+            key=lambda path: path["rows"]
+        )
+        return {
+            "driver": driver,
+            "filters": residual,
+            "date_filter": driver["access"] != "date_index" and (from_dt or to_dt) is not None,
+            "text_filter": bool(query.text),
+            "full_text_match": bool(query.match),
+            "sort": ("index_order" if driver["access"] == "date_index" else
+                     "sort_by_relevance" if query.sort == "relevance" else "sort_by_date"),
+            "limit": limit,
+            "alternatives": [path for path in paths if path is not driver],
+            "total_articles": len(self._articles_by_key),
+        }
+    
+    def explain(self, query: ArticleQuery) -> Dict[str, Any]:
+        """
+        Explains how query would be evaluated over the cached articles
+        
+        Args:
+            query: Query to explain
+            
+        Returns:
+            Query plan (see _plan)
+        """
+        def describe(path: Dict[str, Any]) -> Dict[str, Any]:
+            return {name: value for name, value in path.items() if name != "keys"}
+        
+        plan = self._plan(query)
+        plan["driver"] = describe(plan["driver"])
+        plan["filters"] = [describe(path) for path in plan["filters"]]
+        plan["alternatives"] = [describe(path) for path in plan["alternatives"]]
+        return plan
+    
+    def query(self, query: ArticleQuery,
+              articles: Optional[List[Article]] = None) -> List[Article]:
+        """
+        Evaluates article query in a single lazy pass
+        
+        Without a source list the cached articles are evaluated according to
+        _plan: either walked newest first through the date index (stopping once
+        limit articles match), or driven by the most selective key set.
+        
+        Args:
+            query: Query to evaluate
+            articles: Source list of articles (None = cached article list)
+            
+        Returns:
+            Matching articles
+        """
+        from_dt, to_dt = query.date_bounds()
+        store = self._articles_by_key
+        text = query.text.lower() if query.text else None
+        
+        if articles is None:
+            plan = self._plan(query)
+            driver = plan["driver"]
+            filters = [path["keys"] for path in plan["filters"]]
+            
+            def matches_key(key: Any) -> bool:
+                for keys in filters:
+                    if key not in keys:
+                        return False
+                return text is None or self._matches_text(store[key], text)
+            
+            if driver["access"] == "date_index":
+                results = (
+                    article for article in self._iter_date_range(from_dt, to_dt)
+                    if matches_key(article.key)
+                )
+            else:
+                if driver["access"] == "text_index":
+                    scores = self._bm25_scores(query.match)
+                    driver_keys = scores.keys()
+                else:
+                    scores = None
+                    driver_keys = driver["keys"]
+                
+                candidates = []
+                for key in driver_keys:
+                    published = store[key].published_at
+                    if published is None:
+                        continue
+                    article_date = published.date()
+                    if (from_dt and article_date < from_dt) or (to_dt and article_date > to_dt):
+                        continue
+                    if matches_key(key):
+                        sort_key = self._date_sort_key(published)
+                        if scores is not None and query.sort == "relevance":
+                            sort_key = (scores[key], sort_key)
+                        candidates.append((sort_key, key))
+                candidates.sort(key=lambda item: item[0], reverse=True)
+                results = (store[key] for _, key in candidates)
+        elif query.match:
+            raise ValueError("Full-text match is supported only over cached articles")
+        else:
+            postings = [
+                (self._indexes[field].get(value, ()), self.INDEXED_FIELDS[field], value)
+                for field, value in self._query_constraints(query)
+            ]
+            
+            def matches(article: Article) -> bool:
+                key = article.key
+                indexed = store.get(key) is article
+                for keys, extract, value in postings:
+                    if indexed:
+                        if key not in keys:
+                            return False
+                    elif extract(article) != value:
+                        return False
+                return text is None or self._matches_text(article, text)
+            
+            def dated(article: Article) -> bool:
+                published = article.published_at
+                if published is None:
+                    return not (from_dt or to_dt) and query.sort == "source"
+                article_date = published.date()
+                return not ((from_dt and article_date < from_dt) or
+                            (to_dt and article_date > to_dt))
+            
+            results = (article for article in articles if dated(article) and matches(article))
+            if query.sort == "newest":
+                # Arbitrary source list has to be fully sorted before limiting
+                results = iter(self._newest_first(list(results)))
+        
+        if query.limit and query.limit > 0:
+            return list(itertools.islice(results, query.limit))
+        return list(results)
+    
     async def fetch_article_content(self, url: str) -> Dict[str, Any]:
         """
         Downloads full article content from a given URL
         
+        Parsed content is cached by normalized URL, 404 responses are cached
+        separately for a shorter time. Concurrent requests for the same URL
+        share a single download.
+        
+        Args:
+            url: Article URL
+            
+        Returns:
+            Dict with article content
+        """
+        cache_key = self._normalize_url(url)
+        
+        cached = self._content_cache.get(cache_key)
+        if cached is not None:
+            return {**cached, "url": url}
+        
+        missing = self._missing_content_cache.get(cache_key)
+        if missing is not None:
+            return {**missing, "url": url}
+        
+        stored = await self._read_content_store(cache_key)
+        if stored is not None:
+            self._content_cache.set(cache_key, stored)
+            self._index_content(url, stored.get("content", ""))
+            return {**stored, "url": url}
+        
+        async def download() -> Dict[str, Any]:
+            # Runs once per shared download, so caches and store are written once
+            result = await self._download_article_content(url)
+            if result["success"]:
+                self._content_cache.set(cache_key, result)
+                await self._write_content_store(cache_key, result)
+            elif result.get("status") == 404:
+                self._missing_content_cache.set(cache_key, result)
+            return result
+        
+        result = await self._coalesce(f"content_{cache_key}", download)
+        return {**result, "url": url}
+    
+    async def fetch_articles_content(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Downloads content of several articles concurrently
+        
+        At most content_concurrency downloads run at once, and at most
+        content_per_host of them against a single host, across all
+        concurrent calls. Failures are reported per URL and do not affect
+        the other results.
+        
+        Args:
+            urls: Article URLs
+            
+        Returns:
+            List of content dicts in the order of urls
+        """
+        if self._content_limit is None:
+            self._content_limit = asyncio.Semaphore(self._content_concurrency)
+        limit = self._content_limit
+        
+        async def fetch_one(url: str) -> Dict[str, Any]:
+            host = urlsplit(url).netloc.lower()
+            host_limit = self._content_host_limits.get(host)
+            if host_limit is None:
+                host_limit = self._content_host_limits[host] = asyncio.Semaphore(self._content_per_host)
+            try:
+                async with host_limit, limit:
+                    return await self.fetch_article_content(url)
+            except Exception as e:
+                return {
+                    "success": False,
+                    "error": f"Error downloading article: {str(e)}",
+                    "url": url
+                }
+        
+        return list(await asyncio.gather(*(fetch_one(url) for url in urls)))
+    
+    async def _read_content_store(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Reads content from disk store without blocking the event loop"""
+        if self._content_store is None:
+            return None
+        try:
+            stored = await asyncio.get_running_loop().run_in_executor(
+                None, self._content_store.get, cache_key, self._content_store_max_age
+            )
+        except (sqlite3.Error, ValueError, *ContentStore.DECOMPRESS_ERRORS) as e:
+            self._content_store_stats["errors"] += 1
+            self._content_store_stats["last_error"] = str(e)
+            return None
+        self._content_store_stats["hits" if stored is not None else "misses"] += 1
+        return stored
+    
+    async def _write_content_store(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """Writes content to disk store without blocking the event loop"""
+        if self._content_store is None:
+            return
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._content_store.put, cache_key, result
+            )
+            self._content_store_stats["writes"] += 1
+        except (sqlite3.Error, ValueError) as e:
+            self._content_store_stats["errors"] += 1
+            self._content_store_stats["last_error"] = str(e)
+    
+    async def _read_page(self, response: aiohttp.ClientResponse) -> Optional[str]:
+        """
+        Reads page body in chunks
+        
+        Args:
+            response: Response to read
+            
+        Returns:
+            Decoded page, cut after the content container when early stop is
+            enabled; None if the page is larger than content_max_bytes
+        """
+        if response.content_length is not None and response.content_length > self._content_max_bytes:
+            self._content_stats["too_large"] += 1
+            return None
+        
+        body = bytearray()
+        scanner = ContentEndScanner() if self._content_early_stop else None
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            body.extend(chunk)
+            if len(body) > self._content_max_bytes:
+                self._content_stats["too_large"] += 1
+                self._content_stats["bytes_downloaded"] += len(body)
+                return None
+            if scanner is not None:
+                end = scanner.feed(body)
+                if end is not None:
+                    del body[end:]
+                    self._content_stats["early_stops"] += 1
+                    break
+        
+        self._content_stats["pages_downloaded"] += 1
+        self._content_stats["bytes_downloaded"] += len(body)
+        
+        # Same charset resolution as ClientResponse.text()
+        encoding = "utf-8"
+        if response.charset:
+            try:
+                encoding = codecs.lookup(response.charset).name
+            except LookupError:
+                pass
+        return body.decode(encoding)
+    
+    async def _download_article_content(self, url: str) -> Dict[str, Any]:
+        """
+        Downloads and parses article page
+        
         Args:
             url: Article URL
             
@@ -281,124 +2864,44 @@ class AWSNewsAPI:
         
         try:
             headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+                'Accept-Encoding': ACCEPT_ENCODING
             }
             
             async with session.get(url, headers=headers) as response:
                 if response.status == 200:
-                    html_content = await response.text()
-                    
-                    # Parse HTML using BeautifulSoup
-                    soup = BeautifulSoup(html_content, 'html.parser')
-                    
-                    # Extract title
-                    title = ""
-                    title_tag = soup.find('h1') or soup.find('title')
-                    if title_tag:
-                        title = title_tag.get_text().strip()
-                    
-                    # Extract main content
-                    content = ""
-                    
-                    # Try to find main article content
-                    # AWS blogs usually use these selectors
-                    content_selectors = [
-                        'div.blog-post-content',
-                        'div.entry-content', 
-                        'article.post-content',
-                        'div.content',
-                        'main',
-                        '.blog-post-body',
-                        '.post-body'
-                    ]
-                    
-                    content_element = None
-                    for selector in content_selectors:
-                        content_element = soup.select_one(selector)
-                        if content_element:
-                            break
-                    
-                    # If we don't find specific selector, take all p tags
-                    if not content_element:
-                        paragraphs = soup.find_all('p')
-                        if paragraphs:
-                            content = '\n\n'.join([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
-                    else:
-                        # Clean content from unnecessary tags
-                        # Remove scripts, styles, navigation, etc.
-                        for unwanted in content_element(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-                            unwanted.decompose()
-                        
-                        # Get clean text
-                        content = content_element.get_text()
-                        
-                        # Clean excessive whitespace
-                        content = re.sub(r'\n\s*\n', '\n\n', content)
-                        content = re.sub(r' +', ' ', content)
-                        content = content.strip()
+                    html_content = await self._read_page(response)
+                    if html_content is None:
+                        return {
+                            "success": False,
+                            "error": f"Article page is larger than {self._content_max_bytes} bytes",
+                            "url": url
+                        }
                     
-                    # Extract meta information
-                    meta_description = ""
-                    meta_tag = soup.find('meta', attrs={'name': 'description'}) or soup.find('meta', attrs={'property': 'og:description'})
-                    if meta_tag:
-                        meta_description = meta_tag.get('content', '').strip()
+                    parsed = await self._parse_html(html_content)
                     
-                    # Extract author
-                    author = ""
-                    author_selectors = [
-                        'meta[name="author"]',
-                        '.author',
-                        '.byline', 
-                        '.post-author'
-                    ]
-                    
-                    for selector in author_selectors:
-                        author_element = soup.select_one(selector)
-                        if author_element:
-                            if author_element.name == 'meta':
-                                author = author_element.get('content', '').strip()
-                            else:
-                                author = author_element.get_text().strip()
-                            break
-                    
-                    # Extract publication date from HTML
-                    pub_date = ""
-                    date_selectors = [
-                        'time[datetime]',
-                        'meta[property="article:published_time"]',
-                        '.publish-date',
-                        '.date'
-                    ]
-                    
-                    for selector in date_selectors:
-                        date_element = soup.select_one(selector)
-                        if date_element:
-                            if date_element.name == 'time':
-                                pub_date = date_element.get('datetime', '').strip()
-                            elif date_element.name == 'meta':
-                                pub_date = date_element.get('content', '').strip()
-                            else:
-                                pub_date = date_element.get_text().strip()
-                            break
+                    # Make fetched content searchable
+                    self._index_content(url, parsed["content"])
                     
                     return {
                         "success": True,
                         "url": url,
-                        "title": title,
-                        "content": content,
-                        "description": meta_description,
-                        "author": author,
-                        "published_date": pub_date,
-                        "content_length": len(content),
-                        "word_count": len(content.split()) if content else 0
+                        **parsed
                     }
                 else:
                     return {
                         "success": False,
                         "error": f"HTTP error {response.status} when downloading article",
+                        "status": response.status,
                         "url": url
                     }
                     
+        except asyncio.TimeoutError:
+            return {
+                "success": False,
+                "error": f"Timed out downloading article after {self._total_timeout} s",
+                "url": url
+            }
         except Exception as e:
             return {
                 "success": False,
@@ -406,7 +2909,7 @@ class AWSNewsAPI:
                 "url": url
             }
     
-    def format_article_response(self, articles: List[Dict[str, Any]], 
+    def format_article_response(self, articles: List[Article], 
                               filters_applied: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Formats response with articles
@@ -421,26 +2924,21 @@ class AWSNewsAPI:
         formatted_articles = []
         
         for article in articles:
-            # Parse date for better display
-            published_date = article.get("published_date", "")
-            formatted_date = ""
-            if published_date:
-                try:
-                    dt = date_parser.parse(published_date)
-                    formatted_date = dt.strftime("%Y-%m-%d %H:%M:%S")
-                except:
-                    formatted_date = published_date
+            # Format precomputed date for better display
+            formatted_date = article.published_date
+            if article.published_at is not None:
+                formatted_date = article.published_at.strftime("%Y-%m-%d %H:%M:%S")
             
             formatted_article = {
-                "id": article.get("id", ""),
-                "title": article.get("title", ""),
-                "type": article.get("type", ""),
-                "category": article.get("main_category", ""),
+                "id": article.id,
+                "title": article.title,
+                "type": article.type,
+                "category": article.main_category,
                 "published_date": formatted_date,
-                "url": article.get("url", ""),
-                "slug": article.get("slug", ""),
-                "is_popular": article.get("popular", False),
-                "is_regional_expansion": article.get("is_regional_expansion", False)
+                "url": article.url,
+                "slug": article.slug,
+                "is_popular": article.popular,
+                "is_regional_expansion": article.is_regional_expansion
             }
             formatted_articles.append(formatted_article)
         
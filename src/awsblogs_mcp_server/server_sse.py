@@ -8,15 +8,18 @@ import argparse
 import asyncio
 import json
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
 
 from fastmcp import FastMCP
-from .data_processor import aws_news_api
+from .data_processor import ArticleQuery, aws_news_api
 
 # Create MCP server with SSE transport
 mcp = FastMCP("AWS Blogs and News")
 
+# Maximum number of URLs accepted by get_articles_content
+MAX_BATCH_URLS = 50
+
 class AWSBlogsError(Exception):
     """Base exception for AWS Blogs operations"""
     pass
@@ -43,18 +46,15 @@ async def get_todays_posts(
         Dict containing today's articles
     """
     try:
-        # Download all articles
-        all_articles = await aws_news_api.fetch_articles()
+        # Make sure cached articles are loaded
+        await aws_news_api.fetch_articles()
         
-        # Filter today's articles
-        todays_articles = aws_news_api.filter_todays_articles(all_articles)
-        
-        # Filter by type
-        filtered_articles = aws_news_api.filter_by_type(todays_articles, post_type)
-        
-        # Apply limit
-        if limit > 0:
-            filtered_articles = filtered_articles[:limit]
+        # Query today's articles of given type
+        filtered_articles = aws_news_api.query(ArticleQuery(
+            from_date=datetime.now().strftime("%Y-%m-%d"),
+            article_type=post_type,
+            limit=limit
+        ))
         
         filters_applied = {
             "date": "today",
@@ -107,20 +107,17 @@ async def get_posts_by_date(
         if not days_back and not from_date:
             days_back = 7  # Default: week back
         
-        # Download all articles
-        all_articles = await aws_news_api.fetch_articles()
-        
-        # Filter by date range
-        date_filtered = aws_news_api.filter_by_date_range(
-            all_articles, from_date=from_date, to_date=to_date, days_back=days_back
-        )
+        # Make sure cached articles are loaded
+        await aws_news_api.fetch_articles()
         
-        # Filter by type
-        type_filtered = aws_news_api.filter_by_type(date_filtered, post_type)
-        
-        # Apply limit
-        if limit > 0:
-            type_filtered = type_filtered[:limit]
+        # Query by date range and type
+        type_filtered = aws_news_api.query(ArticleQuery(
+            from_date=from_date,
+            to_date=to_date,
+            days_back=days_back,
+            article_type=post_type,
+            limit=limit
+        ))
         
         filters_applied = {
             "from_date": from_date,
@@ -161,21 +158,16 @@ async def get_posts_by_category(
         Dict containing articles from the given category
     """
     try:
-        # Download all articles
-        all_articles = await aws_news_api.fetch_articles()
-        
-        # Filter by date range
-        date_filtered = aws_news_api.filter_by_date_range(all_articles, days_back=days_back)
-        
-        # Filter by category
-        category_filtered = aws_news_api.filter_by_category(date_filtered, category)
+        # Make sure cached articles are loaded
+        await aws_news_api.fetch_articles()
         
-        # Filter by type
-        type_filtered = aws_news_api.filter_by_type(category_filtered, post_type)
-        
-        # Apply limit
-        if limit > 0:
-            type_filtered = type_filtered[:limit]
+        # Query by date range, category and type
+        type_filtered = aws_news_api.query(ArticleQuery(
+            days_back=days_back,
+            category=category,
+            article_type=post_type,
+            limit=limit
+        ))
         
         filters_applied = {
             "category": category,
@@ -203,10 +195,14 @@ async def search_posts(
     limit: int = 25
 ) -> Dict[str, Any]:
     """
-    Searches articles by text query using AWS News API search functionality.
+    Searches articles by text query, ranked by relevance.
+    
+    Cached articles are searched locally (title, slug, category and already
+    downloaded content) when every query term matches; otherwise AWS News API
+    search is used, which also searches article content.
     
     Args:
-        query: Search query (searches in title, URL, and content via API)
+        query: Search query
         post_type: Post type - "News", "Blog", or "Both" (default)
         days_back: Number of days back from today (default 90)
         limit: Maximum number of articles (default 25)
@@ -223,28 +219,36 @@ async def search_posts(
                 "total_count": 0
             }
         
-        # Use API search functionality with the query
-        search_results = await aws_news_api.fetch_articles(search_query=query)
-        
-        # Filter by date range if specified
-        if days_back and days_back > 0:
-            date_filtered = aws_news_api.filter_by_date_range(search_results, days_back=days_back)
-        else:
-            date_filtered = search_results
-        
-        # Filter by type
-        type_filtered = aws_news_api.filter_by_type(date_filtered, post_type)
-        
-        # Apply limit
-        if limit > 0:
-            type_filtered = type_filtered[:limit]
+        # Search cached articles locally, ranked by relevance
+        await aws_news_api.fetch_articles()
+        type_filtered = aws_news_api.query(ArticleQuery(
+            days_back=days_back if days_back and days_back > 0 else None,
+            article_type=post_type,
+            match=query,
+            sort="relevance",
+            limit=limit
+        ))
+        search_method = "local_bm25"
+        
+        # Fall back to API search functionality (also searches article content)
+        if not type_filtered:
+            search_results = await aws_news_api.fetch_articles(search_query=query)
+            
+            # Filter search results by date range (if specified) and type
+            type_filtered = aws_news_api.query(ArticleQuery(
+                days_back=days_back if days_back and days_back > 0 else None,
+                article_type=post_type,
+                sort="newest" if days_back and days_back > 0 else "source",
+                limit=limit
+            ), articles=search_results)
+            search_method = "api_search"
         
         filters_applied = {
             "query": query,
             "post_type": post_type,
             "days_back": days_back,
             "limit": limit,
-            "search_method": "api_search"
+            "search_method": search_method
         }
         
         return aws_news_api.format_article_response(type_filtered, filters_applied)
@@ -306,25 +310,15 @@ async def get_latest_posts(
         Dict containing latest articles
     """
     try:
-        # Download all articles
-        all_articles = await aws_news_api.fetch_articles()
-        
-        # Filter by date range
-        date_filtered = aws_news_api.filter_by_date_range(all_articles, days_back=days_back)
+        # Make sure cached articles are loaded
+        await aws_news_api.fetch_articles()
         
-        # Filter by type
-        type_filtered = aws_news_api.filter_by_type(date_filtered, post_type)
-        
-        # Sort by publication date (newest first)
-        sorted_articles = sorted(
-            type_filtered,
-            key=lambda x: x.get("published_date", ""),
-            reverse=True
-        )
-        
-        # Apply limit
-        if limit > 0:
-            sorted_articles = sorted_articles[:limit]
+        # Query by date range and type (results come newest first)
+        sorted_articles = aws_news_api.query(ArticleQuery(
+            days_back=days_back,
+            article_type=post_type,
+            limit=limit
+        ))
         
         filters_applied = {
             "post_type": post_type,
@@ -362,31 +356,16 @@ async def get_popular_posts(
         Dict containing popular articles
     """
     try:
-        # Download all articles
-        all_articles = await aws_news_api.fetch_articles()
-        
-        # Filter by date range
-        date_filtered = aws_news_api.filter_by_date_range(all_articles, days_back=days_back)
+        # Make sure cached articles are loaded
+        await aws_news_api.fetch_articles()
         
-        # Filter by type
-        type_filtered = aws_news_api.filter_by_type(date_filtered, post_type)
-        
-        # Filter only popular articles
-        popular_filtered = [
-            article for article in type_filtered
-            if article.get("popular") == True
-        ]
-        
-        # Sort by publication date (newest first)
-        sorted_articles = sorted(
-            popular_filtered,
-            key=lambda x: x.get("published_date", ""),
-            reverse=True
-        )
-        
-        # Apply limit
-        if limit > 0:
-            sorted_articles = sorted_articles[:limit]
+        # Query popular articles by date range and type (results come newest first)
+        sorted_articles = aws_news_api.query(ArticleQuery(
+            days_back=days_back,
+            article_type=post_type,
+            popular_only=True,
+            limit=limit
+        ))
         
         filters_applied = {
             "post_type": post_type,
@@ -406,6 +385,66 @@ async def get_popular_posts(
         }
 
 
+@mcp.tool()
+async def get_new_posts(
+    minutes_back: int = 60,
+    post_type: str = "Both",
+    limit: int = 30
+) -> Dict[str, Any]:
+    """
+    Gets articles that newly appeared in the feed (not just published) recently.
+    
+    Args:
+        minutes_back: How many minutes back to look for new articles (default 60)
+        post_type: Post type - "News", "Blog", or "Both" (default)
+        limit: Maximum number of articles (default 30)
+    
+    Returns:
+        Dict containing newly appeared articles, most recently seen first
+    """
+    try:
+        # Make sure the article store is loaded
+        await aws_news_api.fetch_articles()
+        
+        since = datetime.now() - timedelta(minutes=minutes_back)
+        new_articles = aws_news_api.get_articles_added_since(since)
+        
+        # Filter by type, keeping order in which articles were seen
+        type_filtered = aws_news_api.query(ArticleQuery(
+            article_type=post_type,
+            sort="source",
+            limit=limit
+        ), articles=new_articles)
+        
+        filters_applied = {
+            "minutes_back": minutes_back,
+            "post_type": post_type,
+            "limit": limit
+        }
+        
+        return aws_news_api.format_article_response(type_filtered, filters_applied)
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Error getting new articles: {e}",
+            "articles": [],
+            "total_count": 0
+        }
+
+
+def _article_url_error(url: str) -> Optional[str]:
+    """Returns reason why URL cannot be downloaded, None if it is valid"""
+    if not url.strip():
+        return "Article URL cannot be empty"
+    
+    # Verify that URL is a valid AWS blog/news URL
+    if not ("aws.amazon.com" in url.lower()):
+        return "This tool supports only AWS articles (aws.amazon.com)"
+    
+    return None
+
+
 @mcp.tool()
 async def get_article_content(url: str) -> Dict[str, Any]:
     """
@@ -418,18 +457,11 @@ async def get_article_content(url: str) -> Dict[str, Any]:
         Dict containing full article content including title, author, and meta information
     """
     try:
-        if not url.strip():
+        error = _article_url_error(url)
+        if error:
             return {
                 "success": False,
-                "error": "Article URL cannot be empty",
-                "url": url
-            }
-        
-        # Verify that URL is a valid AWS blog/news URL
-        if not ("aws.amazon.com" in url.lower()):
-            return {
-                "success": False,
-                "error": "This tool supports only AWS articles (aws.amazon.com)",
+                "error": error,
                 "url": url
             }
         
@@ -446,20 +478,280 @@ async def get_article_content(url: str) -> Dict[str, Any]:
         }
 
 
+@mcp.tool()
+async def get_articles_content(urls: List[str]) -> Dict[str, Any]:
+    """
+    Downloads full content of several articles concurrently.
+    
+    Args:
+        urls: Article URLs (can be obtained from other tools), at most 50
+    
+    Returns:
+        Dict containing article contents in the order of urls, failed URLs have their own error
+    """
+    try:
+        if not urls:
+            return {
+                "success": False,
+                "error": "At least one article URL is required"
+            }
+        
+        if len(urls) > MAX_BATCH_URLS:
+            return {
+                "success": False,
+                "error": f"At most {MAX_BATCH_URLS} URLs can be downloaded at once"
+            }
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(urls)
+        valid = []
+        for i, url in enumerate(urls):
+            error = _article_url_error(url)
+            if error:
+                results[i] = {"success": False, "error": error, "url": url}
+            else:
+                valid.append(i)
+        
+        # Download valid URLs concurrently
+        contents = await aws_news_api.fetch_articles_content([urls[i] for i in valid])
+        for i, content in zip(valid, contents):
+            results[i] = content
+        
+        return {
+            "success": True,
+            "articles": results,
+            "count": len(results),
+            "succeeded": sum(1 for result in results if result["success"]),
+            "failed": sum(1 for result in results if not result["success"])
+        }
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Error downloading article contents: {e}"
+        }
+
+
+@mcp.tool()
+async def explain_query(
+    category: Optional[str] = None,
+    post_type: str = "Both",
+    days_back: Optional[int] = None,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    popular_only: bool = False,
+    limit: int = 20
+) -> Dict[str, Any]:
+    """
+    Explains how an article query would be evaluated (for debugging slow tool calls).
+    
+    Args:
+        category: Category name (optional)
+        post_type: Post type - "News", "Blog", or "Both" (default)
+        days_back: Number of days back from today (optional)
+        from_date: From date in YYYY-MM-DD format (optional)
+        to_date: To date in YYYY-MM-DD format (optional)
+        popular_only: Only popular articles (default False)
+        limit: Maximum number of articles (default 20)
+    
+    Returns:
+        Dict containing chosen index, filter order and cost estimates
+    """
+    try:
+        # Make sure cached articles are loaded
+        await aws_news_api.fetch_articles()
+        
+        plan = aws_news_api.explain(ArticleQuery(
+            from_date=from_date,
+            to_date=to_date,
+            days_back=days_back,
+            category=category,
+            article_type=post_type,
+            popular_only=popular_only,
+            limit=limit
+        ))
+        
+        return {
+            "success": True,
+            "plan": plan
+        }
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Error explaining query: {e}",
+            "plan": {}
+        }
+
+
+@mcp.tool()
+async def get_cache_stats(include_entries: bool = False) -> Dict[str, Any]:
+    """
+    Gets memory usage of server caches.
+    
+    Args:
+        include_entries: Include details of individual cache entries (default False)
+    
+    Returns:
+        Dict containing memory budget, eviction policy and per-cache entries, sizes and eviction counts
+    """
+    try:
+        return {
+            "success": True,
+            "caches": aws_news_api.get_cache_stats(include_entries)
+        }
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Error getting cache stats: {e}",
+            "caches": {}
+        }
+
+
+@mcp.tool()
+async def get_server_stats() -> Dict[str, Any]:
+    """
+    Gets server cache and upstream fetch statistics.
+    
+    Returns:
+        Dict containing cache hit/miss counters and number of coalesced requests
+    """
+    try:
+        return {
+            "success": True,
+            "stats": aws_news_api.get_stats()
+        }
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Error getting server stats: {e}",
+            "stats": {}
+        }
+
+
+async def serve(host: str, port: int):
+    """Runs MCP server together with the background article refresher"""
+    aws_news_api.start_refresher()
+    try:
+        await mcp.run_async(transport="sse", host=host, port=port)
+    finally:
+        await aws_news_api.close()
+
+
 def main():
     """Main function for running MCP server with SSE transport"""
     parser = argparse.ArgumentParser(description="AWS Blogs MCP Server - SSE Version")
     parser.add_argument("--host", default="0.0.0.0", help="Host to bind to")
     parser.add_argument("--port", type=int, default=8807, help="Port to bind to")
+    parser.add_argument("--cache-soft-ttl", type=int, default=300,
+                        help="Seconds the article list is served as fresh")
+    parser.add_argument("--cache-hard-ttl", type=int, default=3600,
+                        help="Seconds the article list may be served stale while refreshing in background")
+    parser.add_argument("--cache-max-staleness", type=int, default=86400,
+                        help="Maximum age in seconds of stale article list served when refresh fails")
+    parser.add_argument("--refresh-interval", type=int, default=240,
+                        help="Seconds between background article list refreshes (0 = disabled)")
+    parser.add_argument("--refresh-jitter", type=int, default=30,
+                        help="Maximum random deviation in seconds of the refresh interval")
+    parser.add_argument("--snapshot-path", default=None,
+                        help="File for persisting the article list across restarts (default: disabled)")
+    parser.add_argument("--search-cache-size", type=int, default=256,
+                        help="Maximum number of cached API search results")
+    parser.add_argument("--search-cache-ttl", type=int, default=300,
+                        help="Seconds an API search result stays cached")
+    parser.add_argument("--cache-max-mb", type=int, default=64,
+                        help="Estimated memory budget of all bounded caches in MB")
+    parser.add_argument("--cache-policy", choices=["lru", "lfu", "ttl"], default="lru",
+                        help="Eviction policy when the cache memory budget is exceeded")
+    parser.add_argument("--content-cache-size", type=int, default=512,
+                        help="Maximum number of cached article contents")
+    parser.add_argument("--content-cache-ttl", type=int, default=3600,
+                        help="Seconds downloaded article content stays cached")
+    parser.add_argument("--content-store-path", default=None,
+                        help="SQLite file keeping parsed article content across restarts (default: disabled)")
+    parser.add_argument("--content-store-max-age", type=int, default=7 * 86400,
+                        help="Seconds stored article content is reused before downloading again")
+    parser.add_argument("--content-concurrency", type=int, default=8,
+                        help="Maximum concurrent article downloads in get_articles_content")
+    parser.add_argument("--content-per-host", type=int, default=4,
+                        help="Maximum concurrent article downloads from one host")
+    parser.add_argument("--content-max-mb", type=int, default=5,
+                        help="Largest article page downloaded in MB, larger pages are rejected")
+    parser.add_argument("--content-early-stop", action="store_true",
+                        help="Stop downloading an article page once its content container has closed")
+    parser.add_argument("--pool-limit", type=int, default=100,
+                        help="Maximum open HTTP connections (0 = unlimited)")
+    parser.add_argument("--pool-limit-per-host", type=int, default=16,
+                        help="Maximum open HTTP connections per host (0 = unlimited)")
+    parser.add_argument("--keepalive-timeout", type=float, default=60,
+                        help="Seconds an idle HTTP connection is kept open for reuse")
+    parser.add_argument("--dns-cache-ttl", type=int, default=300,
+                        help="Seconds resolved host addresses are cached (0 = no DNS cache)")
+    parser.add_argument("--no-happy-eyeballs", action="store_true",
+                        help="Connect to resolved addresses one at a time (requires aiohttp 3.10+)")
+    parser.add_argument("--connect-timeout", type=float, default=10,
+                        help="Seconds to wait for an HTTP connection")
+    parser.add_argument("--read-timeout", type=float, default=30,
+                        help="Seconds to wait for data from an HTTP connection")
+    parser.add_argument("--total-timeout", type=float, default=60,
+                        help="Seconds an HTTP request may take in total")
+    parser.add_argument("--parse-executor", choices=["process", "thread", "inline"], default="process",
+                        help="Where downloaded article HTML is parsed (default: worker processes)")
+    parser.add_argument("--parse-workers", type=int, default=None,
+                        help="Number of parse workers (default: number of CPUs)")
+    parser.add_argument("--html-extractor", choices=["auto", "lxml", "bs4-partial", "bs4"], default="auto",
+                        help="Article HTML extractor (default: lxml when installed, partial BeautifulSoup parsing otherwise)")
     
     args = parser.parse_args()
     
+    try:
+        aws_news_api.configure(
+            soft_ttl=args.cache_soft_ttl,
+            hard_ttl=args.cache_hard_ttl,
+            max_staleness=args.cache_max_staleness,
+            refresh_interval=args.refresh_interval,
+            refresh_jitter=args.refresh_jitter,
+            snapshot_path=args.snapshot_path,
+            search_cache_size=args.search_cache_size,
+            search_cache_ttl=args.search_cache_ttl,
+            cache_max_bytes=args.cache_max_mb * 1024 * 1024,
+            cache_policy=args.cache_policy,
+            content_cache_size=args.content_cache_size,
+            content_cache_ttl=args.content_cache_ttl,
+            content_store_max_age=args.content_store_max_age,
+            content_concurrency=args.content_concurrency,
+            content_per_host=args.content_per_host,
+            content_max_bytes=args.content_max_mb * 1024 * 1024,
+            content_early_stop=args.content_early_stop,
+            pool_limit=args.pool_limit,
+            pool_limit_per_host=args.pool_limit_per_host,
+            keepalive_timeout=args.keepalive_timeout,
+            dns_cache_ttl=args.dns_cache_ttl,
+            happy_eyeballs=not args.no_happy_eyeballs,
+            connect_timeout=args.connect_timeout,
+            read_timeout=args.read_timeout,
+            total_timeout=args.total_timeout,
+            parse_executor=args.parse_executor,
+            parse_workers=args.parse_workers,
+            html_extractor=args.html_extractor,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    
     print(f"AWS Blogs MCP Server (SSE) initialized", file=sys.stderr)
     print(f"Starting server on {args.host}:{args.port}", file=sys.stderr)
     print(f"API endpoint: https://api.aws-news.com/articles", file=sys.stderr)
     
+    # Start warm from the last persisted article list
+    if aws_news_api.load_snapshot():
+        print(f"Loaded article snapshot from {args.snapshot_path}", file=sys.stderr)
+    if args.content_store_path:
+        aws_news_api.open_content_store(args.content_store_path)
+        print(f"Using article content store {args.content_store_path}", file=sys.stderr)
+    
     # Start MCP server with SSE transport
-    mcp.run(transport="sse", host=args.host, port=args.port)
+    asyncio.run(serve(args.host, args.port))
 
 
 if __name__ == "__main__":
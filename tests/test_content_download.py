@@ -0,0 +1,103 @@
+"""
+Tests of article content downloads against a local aiohttp stand-in
+"""
+
+import asyncio
+import os
+import sys
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from awsblogs_mcp_server.data_processor import AWSNewsAPI
+
+PAGE = """<html><head><title>Post {n}</title><meta name="author" content="Jane Doe"></head>
+<body><h1>Post {n}</h1><div class="blog-post-content"><p>Body of post {n}</p></div></body></html>"""
+
+
+class StandIn:
+    """Serves article pages slowly, recording peak number of concurrent requests"""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.inflight = 0
+        self.peak = 0
+        self.requests = 0
+        self.server = None
+
+    async def page(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        self.inflight += 1
+        self.peak = max(self.peak, self.inflight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.inflight -= 1
+        return web.Response(text=PAGE.format(n=request.match_info["n"]), content_type="text/html")
+
+    async def __aenter__(self) -> "StandIn":
+        app = web.Application()
+        app.router.add_get("/blogs/test/{n}", self.page)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.server.close()
+
+    def url(self, n: int) -> str:
+        return str(self.server.make_url(f"/blogs/test/{n}"))
+
+
+def test_concurrency_limits_are_shared_across_calls():
+    async def run() -> int:
+        api = AWSNewsAPI(parse_executor="inline", content_concurrency=3, content_per_host=2)
+        try:
+            async with StandIn() as stand_in:
+                batches = [[stand_in.url(batch * 10 + i) for i in range(6)] for batch in range(3)]
+                results = await asyncio.gather(*(api.fetch_articles_content(urls) for urls in batches))
+                assert all(item["success"] for batch in results for item in batch)
+                return stand_in.peak
+        finally:
+            await api.close()
+
+    assert asyncio.run(run()) == 2
+
+
+def test_configure_replaces_concurrency_limits():
+    async def run() -> int:
+        api = AWSNewsAPI(parse_executor="inline", content_concurrency=1, content_per_host=1)
+        try:
+            async with StandIn() as stand_in:
+                await api.fetch_articles_content([stand_in.url(0)])
+                api.configure(content_concurrency=4, content_per_host=4)
+                await api.fetch_articles_content([stand_in.url(i) for i in range(1, 9)])
+                return stand_in.peak
+        finally:
+            await api.close()
+
+    assert asyncio.run(run()) == 4
+
+
+def test_shared_download_is_cached_and_stored_once(tmp_path):
+    async def run():
+        api = AWSNewsAPI(parse_executor="inline", content_store_path=str(tmp_path / "content.sqlite3"))
+        try:
+            async with StandIn() as stand_in:
+                urls = [stand_in.url(1), stand_in.url(2), stand_in.url(1) + "?utm_source=x", stand_in.url(3)]
+                first, second = await asyncio.gather(
+                    api.fetch_articles_content(urls), api.fetch_article_content(stand_in.url(2))
+                )
+                assert all(item["success"] for item in first) and second["success"]
+                assert [item["url"] for item in first] == urls
+                return stand_in.requests, api.get_stats()["content_store"]
+        finally:
+            await api.close()
+
+    requests, store_stats = asyncio.run(run())
+    assert requests == 3
+    assert store_stats["writes"] == 3
+    assert store_stats["pages"] == 3
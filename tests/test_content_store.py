@@ -0,0 +1,72 @@
+"""
+Tests of the SQLite store of parsed article content
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from awsblogs_mcp_server.data_processor import ContentStore
+
+RESULT = {"success": True, "title": "Post", "content": "Body text", "author": "Jane Doe"}
+
+
+@pytest.fixture
+def store(tmp_path):
+    content_store = ContentStore(str(tmp_path / "content.sqlite3"))
+    yield content_store
+    content_store.close()
+
+
+def stored_codecs(store):
+    return store._db.execute("SELECT codec FROM contents").fetchall()
+
+
+def test_put_and_get(store):
+    store.put("https://aws.amazon.com/blogs/a", {**RESULT, "url": "https://aws.amazon.com/blogs/a"})
+    assert store.get("https://aws.amazon.com/blogs/a") == RESULT
+    assert store.get("https://aws.amazon.com/blogs/missing") is None
+
+
+def test_put_rewrites_content_stored_with_other_codec(store):
+    # e.g. written as zstd and read without zstandard installed
+    other_codec = "zlib" if store.codec == "zstd" else "zstd"
+    store.put("https://aws.amazon.com/blogs/a", RESULT)
+    store._db.execute("UPDATE contents SET codec = ?, payload = ?", (other_codec, b"\x28\xb5\x2f\xfd payload"))
+    store._db.commit()
+
+    store.put("https://aws.amazon.com/blogs/a", RESULT)
+    assert stored_codecs(store) == [(store.codec,)]
+    assert store.get("https://aws.amazon.com/blogs/a") == RESULT
+
+
+def test_put_rewrites_corrupt_content(store):
+    store.put("https://aws.amazon.com/blogs/a", RESULT)
+    store._db.execute("UPDATE contents SET payload = ?", (b"corrupt payload",))
+    store._db.commit()
+    with pytest.raises(ContentStore.DECOMPRESS_ERRORS):
+        store.get("https://aws.amazon.com/blogs/a")
+
+    store.put("https://aws.amazon.com/blogs/a", RESULT)
+    assert store.get("https://aws.amazon.com/blogs/a") == RESULT
+
+
+def test_put_drops_previous_content_only_when_unreferenced(store):
+    changed = {**RESULT, "content": "Updated body"}
+    store.put("https://aws.amazon.com/blogs/a", RESULT)
+    store.put("https://aws.amazon.com/blogs/a?alias", RESULT)
+    assert store.stats()["unique_contents"] == 1
+
+    # Content still referenced by the alias is kept
+    store.put("https://aws.amazon.com/blogs/a", changed)
+    assert store.stats()["unique_contents"] == 2
+    assert store.get("https://aws.amazon.com/blogs/a?alias") == RESULT
+
+    # Last reference gone, old content is deleted
+    store.put("https://aws.amazon.com/blogs/a?alias", changed)
+    assert store.stats()["unique_contents"] == 1
+    assert store.stats()["pages"] == 2
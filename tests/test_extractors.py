@@ -0,0 +1,81 @@
+"""
+Parity tests of the article HTML extractors
+
+extract_article_lxml and extract_article_bs4_partial must return the same
+fields as the full BeautifulSoup parse (extract_article_bs4), since
+--html-extractor auto picks lxml whenever it is installed.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from awsblogs_mcp_server.data_processor import (
+    extract_article_bs4,
+    extract_article_bs4_partial,
+    extract_article_lxml,
+    lxml_html,
+)
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+FIXTURES = sorted(name for name in os.listdir(FIXTURES_DIR) if name.endswith(".html"))
+
+# Invalid markup as it appears on real pages; parsers repair it, fields must still match
+MALFORMED = {
+    "unclosed_paragraphs": '<main><h1>Title</h1><p>one<p>two<div class="blog-post-content"><p>three<p>four</div></main>',
+    "unclosed_list_items": '<div class="blog-post-content"><ul><li>one<li>two<li>three</ul><p>after</div>',
+    "stray_closing_tags": '<div class="blog-post-content"><p>text</span></b></p></div></div><p>outside</p>',
+    "unclosed_container": '<title>T</title><div class="blog-post-content"><p>never closed <b>bold',
+    "misnested_inline": '<div class="blog-post-content"><p><b>bold <i>both</b> italic</i> plain</p></div>',
+    "unclosed_script": '<div class="blog-post-content"><p>before</p><script>var a = "<p>not text</p>";',
+    "no_html_body": '<h1>Bare</h1><span class="author">Ann</span><time datetime="2024-02-03">Feb 3</time>'
+                    '<p>Only a paragraph</p>',
+    "uppercase_tags": '<HTML><BODY><DIV CLASS="blog-post-content"><P>Upper   case</P></DIV><META NAME="author" CONTENT="Bob">',
+}
+
+
+def load_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+requires_lxml = pytest.mark.skipif(lxml_html is None, reason="lxml is not installed")
+
+
+@requires_lxml
+@pytest.mark.parametrize("name", FIXTURES)
+def test_lxml_matches_bs4_on_fixture(name):
+    html = load_fixture(name)
+    assert extract_article_lxml(html) == extract_article_bs4(html)
+
+
+@pytest.mark.parametrize("name", FIXTURES)
+def test_bs4_partial_matches_bs4_on_fixture(name):
+    html = load_fixture(name)
+    assert extract_article_bs4_partial(html) == extract_article_bs4(html)
+
+
+@requires_lxml
+@pytest.mark.parametrize("name", sorted(MALFORMED))
+def test_lxml_matches_bs4_on_malformed_markup(name):
+    html = MALFORMED[name]
+    assert extract_article_lxml(html) == extract_article_bs4(html)
+
+
+@pytest.mark.parametrize("name", sorted(MALFORMED))
+def test_bs4_partial_matches_bs4_on_malformed_markup(name):
+    html = MALFORMED[name]
+    assert extract_article_bs4_partial(html) == extract_article_bs4(html)
+
+
+def test_fixture_fields():
+    fields = extract_article_bs4(load_fixture("aws_news_blog_post.html"))
+    assert fields["title"] == "Amazon S3 Express One Zone now supports append data"
+    assert fields["published_date"] == "2025-07-15T16:01:22-07:00"
+    assert "Today, we’re announcing" in fields["content"]
+    assert "--write-offset-bytes 1048576" in fields["content"]
+    assert "classList" not in fields["content"]
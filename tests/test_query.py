@@ -0,0 +1,73 @@
+"""
+Tests of article query planning and evaluation over the cached articles
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from awsblogs_mcp_server.data_processor import AWSNewsAPI, ArticleQuery
+
+
+def make_articles(count: int = 200):
+    now = datetime.now()
+    return [
+        {
+            "id": f"a{i}",
+            "title": f"Article {i}",
+            "type": "News" if i % 2 else "Blog",
+            "main_category": "Compute" if i % 3 else "Storage",
+            "published_date": (now - timedelta(days=i)).strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+            "url": f"https://aws.amazon.com/blogs/test/post-{i}/",
+            "slug": f"post-{i}",
+            "popular": i % 7 == 0,
+            "is_regional_expansion": False,
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def api():
+    client = AWSNewsAPI()
+    client._ingest(make_articles(), datetime.now())
+    return client
+
+
+def days_ago(days: int) -> str:
+    return (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+@pytest.mark.parametrize("constraints", [
+    {"article_type": "News"},
+    {"category": "compute"},
+    {"popular_only": True},
+    {"article_type": "Blog", "category": "storage", "limit": 5},
+])
+def test_inverted_date_range_with_posting_list_constraint(api, constraints):
+    query = ArticleQuery(from_date=days_ago(5), to_date=days_ago(100), **constraints)
+
+    plan = api.explain(query)
+    assert plan["driver"]["rows"] >= 0
+    assert all(path["cost"] >= 0 for path in [plan["driver"]] + plan["alternatives"])
+    assert api.query(query) == []
+
+
+def test_inverted_date_range_without_constraints(api):
+    query = ArticleQuery(from_date=days_ago(5), to_date=days_ago(100))
+    assert api.query(query) == []
+
+
+def test_date_range_with_posting_list_constraint(api):
+    query = ArticleQuery(from_date=days_ago(100), to_date=days_ago(5), article_type="News")
+    expected = [
+        article for article in api.filter_by_date_range(api._cache["articles_all"], days_ago(100), days_ago(5))
+        if article.type == "News"
+    ]
+    assert expected
+    assert api.query(query) == expected
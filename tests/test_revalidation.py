@@ -0,0 +1,88 @@
+"""
+Tests of article list revalidation against a local aiohttp stand-in emitting ETags
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import sys
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from awsblogs_mcp_server.data_processor import AWSNewsAPI
+
+ARTICLES = [
+    {
+        "id": f"a{i}",
+        "title": f"Amazon S3 feature {i}",
+        "type": "News",
+        "main_category": "Storage",
+        "published_date": "2025-07-15T16:01:22.000Z",
+        "url": f"https://aws.amazon.com/blogs/test/post-{i}/",
+        "slug": f"post-{i}",
+        "popular": False,
+        "is_regional_expansion": False,
+    }
+    for i in range(300)
+]
+BODY = json.dumps({"articles": ARTICLES}).encode()
+ETAG = '"%s"' % hashlib.sha256(BODY).hexdigest()
+GZIPPED = gzip.compress(BODY)
+
+
+def make_app(chunked: bool) -> web.Application:
+    async def articles(request: web.Request) -> web.StreamResponse:
+        if request.headers.get("If-None-Match") == ETAG:
+            return web.Response(status=304, headers={"ETag": ETAG})
+        headers = {"ETag": ETAG, "Content-Type": "application/json", "Content-Encoding": "gzip"}
+        if not chunked:
+            return web.Response(body=GZIPPED, headers=headers)
+        response = web.StreamResponse(headers=headers)
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        for pos in range(0, len(GZIPPED), 1024):
+            await response.write(GZIPPED[pos:pos + 1024])
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_get("/articles", articles)
+    return app
+
+
+async def fetch_twice(chunked: bool) -> dict:
+    server = TestServer(make_app(chunked))
+    await server.start_server()
+    api = AWSNewsAPI()
+    api.BASE_URL = str(server.make_url("/articles"))
+    try:
+        first = await api.fetch_articles()
+        second = await api._download_articles()
+        assert second is first
+        return api.get_stats()["articles"]
+    finally:
+        await api.close()
+        await server.close()
+
+
+def test_not_modified_counts_transferred_size():
+    stats = asyncio.run(fetch_twice(chunked=False))
+    assert stats["not_modified_responses"] == 1
+    assert stats["bytes_downloaded"] == len(BODY)
+    assert stats["bytes_transferred"] == len(GZIPPED)
+    assert stats["bytes_saved"] == len(GZIPPED)
+
+
+def test_not_modified_after_chunked_response_counts_nothing():
+    stats = asyncio.run(fetch_twice(chunked=True))
+    assert stats["not_modified_responses"] == 1
+    assert stats["bytes_downloaded"] == len(BODY)
+    assert stats["bytes_transferred"] == 0
+    assert stats["transfers_without_length"] == 1
+    assert stats["bytes_saved"] == 0
@@ -0,0 +1,43 @@
+"""
+Tests of upstream article search against a local aiohttp stand-in
+"""
+
+import asyncio
+import os
+import sys
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from awsblogs_mcp_server.data_processor import AWSNewsAPI
+
+
+def test_search_sends_original_query_and_caches_by_normalized_query():
+    searches = []
+
+    async def articles(request: web.Request) -> web.Response:
+        searches.append(request.query["search"])
+        return web.json_response({"articles": []})
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/articles", articles)
+        server = TestServer(app)
+        await server.start_server()
+        api = AWSNewsAPI()
+        api.BASE_URL = str(server.make_url("/articles"))
+        try:
+            await asyncio.gather(
+                api.fetch_articles(search_query="Amazon  S3"),
+                api.fetch_articles(search_query="amazon s3"),
+            )
+            await api.fetch_articles(search_query=" AMAZON S3 ")
+        finally:
+            await api.close()
+            await server.close()
+
+    asyncio.run(run())
+    assert searches == ["Amazon  S3"]